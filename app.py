@@ -24,6 +24,7 @@ sys.excepthook = _excepthook
 
 from pathlib import Path
 
+import numpy as np
 from PySide6.QtCore import Qt, QSettings
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QDockWidget, QFileDialog, QMessageBox, QStatusBar,
@@ -68,6 +69,7 @@ class TesseractViewer(QMainWindow):
         self._env = None
         self._paths = (None, None)  # urdf, srdf
         self._joint_limits = {}  # joint name -> (lower, upper, current)
+        self._traj_joint_order = None  # order last handed to scene.update_joint_positions
         self._settings = QSettings("tesseract_qt", "viewer")
         self._recent_actions = []
         self.state_mgr = StateManager()
@@ -276,10 +278,7 @@ class TesseractViewer(QMainWindow):
 
         # Connections - FK/IK from ManipulationWidget
         self.manip_widget.jointValuesChanged.connect(self.render.update_joint_values)
-        self.manip_widget.jointValuesChanged.connect(self.info_panel.update_joint_values)
-        self.manip_widget.jointValuesChanged.connect(self.ik_widget.update_current_tcp_pose)
-        self.manip_widget.jointValuesChanged.connect(self._check_collisions_realtime)
-        self.manip_widget.jointValuesChanged.connect(self._update_tcp_status)
+        self.manip_widget.jointValuesChanged.connect(self._on_joint_values_changed)
         self.tree.linkSelected.connect(lambda n: (self.render.scene.highlight_link(n), self.render.render()))
         self.tree.linkSelected.connect(self.info_panel.set_tcp_link)
         self.tree.linkVisibilityChanged.connect(lambda n, v: (self.render.scene.set_link_visibility(n, v), self.render.render()))
@@ -338,6 +337,7 @@ class TesseractViewer(QMainWindow):
 
             logger.info("Environment initialized, loading into render widget")
             self.render.load_environment(self._env)
+            self._traj_joint_order = None  # scene dropped its cached order
             logger.info("Render loaded, setting up tree")
             self.tree.load_environment(self._env)
             logger.info("Tree loaded, setting up manipulation widget")
@@ -577,12 +577,41 @@ class TesseractViewer(QMainWindow):
     def _on_trajectory_frame_changed(self, frame_idx: int):
         """Update joint values when trajectory frame changes."""
         waypoint = self.traj_player.get_waypoint()
-        if waypoint:
+        if isinstance(waypoint, np.ndarray):
+            self._apply_trajectory_row(waypoint)
+        elif waypoint is not None:
             # Handle both dict and object waypoints
             joints = waypoint.get('joints') if isinstance(waypoint, dict) else getattr(waypoint, 'joints', None)
             if joints:
                 self.manip_widget.set_joint_values(joints)
 
+    def _apply_trajectory_row(self, positions: np.ndarray):
+        """Show one row of an array trajectory - scene via the array path, panels via dict."""
+        if self._env is None:
+            return
+        joint_names = self.traj_player.get_joint_names() or self._env.getActiveJointNames()
+        if len(joint_names) != len(positions):
+            logger.warning(f"Trajectory row has {len(positions)} values for {len(joint_names)} joints")
+            return
+
+        # the scene caches the order - hand it over only when it changes
+        joint_order = None
+        if joint_names != self._traj_joint_order:
+            joint_order = self._traj_joint_order = list(joint_names)
+        self.render.scene.update_joint_positions(positions, joint_order)
+
+        joints = dict(zip(joint_names, positions.tolist()))
+        # sliders follow without re-emitting - the scene is already updated
+        self.manip_widget.set_joint_values(joints, emit_signal=False)
+        self._on_joint_values_changed(joints)
+
+    def _on_joint_values_changed(self, joint_values: dict[str, float]):
+        """Fan joint values out to everything but the scene - shared by sliders and playback."""
+        self.info_panel.update_joint_values(joint_values)
+        self.ik_widget.update_current_tcp_pose(joint_values)
+        self._check_collisions_realtime(joint_values)
+        self._update_tcp_status(joint_values)
+
     def _export_screenshot(self):
         """Export screenshot as PNG."""
         path, _ = QFileDialog.getSaveFileName(self, "Export Screenshot", "", "PNG (*.png)")
@@ -1079,7 +1108,7 @@ class TesseractViewer(QMainWindow):
             # Refresh group lists in other widgets
             groups = self._get_group_names()
             self.manip_widget.set_groups(groups)
-            self.group_states_widget.set_groups(groups)
+            self.group_states_widget.set_groups(groups, emit_signal=False)
 
         except Exception as e:
             logger.error(f"Failed to add kinematic group: {e}")
@@ -1112,7 +1141,7 @@ class TesseractViewer(QMainWindow):
                 # Refresh group lists
                 groups = self._get_group_names()
                 self.manip_widget.set_groups(groups)
-                self.group_states_widget.set_groups(groups)
+                self.group_states_widget.set_groups(groups, emit_signal=False)
             else:
                 logger.warning(f"Group '{name}' not found")
                 self.statusBar().showMessage(f"Group '{name}' not found")
@@ -1130,7 +1159,7 @@ class TesseractViewer(QMainWindow):
             # Refresh all widgets with current group info
             groups = self._get_group_names()
             self.manip_widget.set_groups(groups)
-            self.group_states_widget.set_groups(groups)
+            self.group_states_widget.set_groups(groups, emit_signal=False)
             self._load_group_states_from_env()
 
             logger.info("Kinematic groups applied")
@@ -1197,7 +1226,7 @@ class TesseractViewer(QMainWindow):
             self.manip_widget.set_groups(groups)
 
             # Populate Group States Editor
-            self.group_states_widget.set_groups(groups)
+            self.group_states_widget.set_groups(groups, emit_signal=False)
             self._load_group_states_from_env()
 
             # Populate TCP Editor
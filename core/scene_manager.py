@@ -25,6 +25,7 @@ class SceneManager:
         self._visual_origins: dict = {}  # Visual origin transforms
         self.frame_size: float = 0.1
         self._env = None
+        self._joint_order: list[str] | None = None  # cached for update_joint_positions
         self._tcp_link: str | None = None
         self.workspace_actor: vtk.vtkActor | None = None
         self.contact_viz = ContactVisualizer(renderer)
@@ -47,6 +48,7 @@ class SceneManager:
         """Load tesseract environment into VTK scene."""
         self.clear()
         self._env = env
+        self._joint_order = None
         self._visual_origins = {}  # Store visual origins for transform combining
 
         scene_graph = env.getSceneGraph()
@@ -143,6 +145,34 @@ class SceneManager:
         except Exception as e:
             print(f"setState error: {e}")
 
+        self._refresh_from_env()
+
+    def update_joint_positions(self, positions: np.ndarray, joint_order: list[str] | None = None):
+        """Update scene from a joint position array (hot path for playback).
+
+        Args:
+            positions: (N,) joint positions ordered as joint_order
+            joint_order: joint names; cached, so later calls can omit it.
+                Defaults to the environment's active joint names.
+        """
+        if self._env is None:
+            return
+
+        if joint_order is not None:
+            self._joint_order = list(joint_order)
+        elif self._joint_order is None:
+            self._joint_order = list(self._env.getActiveJointNames())
+
+        # Set joint positions using names + array overload
+        try:
+            self._env.setState(self._joint_order, np.asarray(positions, dtype=np.float64))
+        except Exception as e:
+            print(f"setState error: {e}")
+
+        self._refresh_from_env()
+
+    def _refresh_from_env(self):
+        """Apply current environment state to actors and re-render."""
         self.update_from_state(self._env.getState())
         rw = self.renderer.GetRenderWindow()
         if rw:
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Test coordinate frame visualization."""
+"""Coordinate frame visualization demo."""
 from __future__ import annotations
 
 import sys
@@ -7,6 +7,8 @@ from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from app import TesseractViewer
 
 
@@ -0,0 +1,61 @@
+"""Resource locators for tests: memoized lookups and mesh-free parsing."""
+import tesseract_robotics.tesseract_scene_graph  # noqa: F401 - SceneGraph type for parse results
+from tesseract_robotics.tesseract_common import BytesResource, GeneralResourceLocator, ResourceLocator
+from tesseract_robotics.tesseract_urdf import parseURDFFile
+
+MESH_EXTENSIONS = (".stl", ".dae", ".obj", ".ply")
+
+# single-triangle ascii STL - the smallest mesh the URDF parser accepts
+# (an empty resource fails the whole parse)
+_PLACEHOLDER_STL = b"""solid placeholder
+facet normal 0 0 1
+outer loop
+vertex 0 0 0
+vertex 1 0 0
+vertex 0 1 0
+endloop
+endfacet
+endsolid placeholder
+"""
+
+
+class CachedLocator(ResourceLocator):
+    """ResourceLocator memoizing package:// / file:// resolutions by URL.
+
+    Wraps a GeneralResourceLocator instead of subclassing it - the binding
+    only dispatches Python overrides for the abstract ResourceLocator.
+    """
+
+    def __init__(self, locator: GeneralResourceLocator | None = None):
+        super().__init__()
+        self._locator = locator or GeneralResourceLocator()
+        self._cache = {}
+
+    def locateResource(self, url):
+        resource = self._cache.get(url)
+        if resource is None:
+            resource = self._locator.locateResource(url)
+            self._cache[url] = resource
+        return resource
+
+
+class NoMeshLocator(ResourceLocator):
+    """ResourceLocator resolving every mesh URL to a one-triangle placeholder."""
+
+    def __init__(self, locator: ResourceLocator):
+        super().__init__()
+        self._locator = locator
+
+    def locateResource(self, url):
+        if url.lower().endswith(MESH_EXTENSIONS):
+            return BytesResource("placeholder.stl", _PLACEHOLDER_STL)
+        return self._locator.locateResource(url)
+
+
+def parse_urdf_no_meshes(path, locator: ResourceLocator):
+    """parse URDF into a SceneGraph without reading any mesh files.
+
+    Links, joints, limits and origins match a full parse; mesh geometries
+    are placeholders, so don't render or collision-check the result.
+    """
+    return parseURDFFile(str(path), NoMeshLocator(locator))
@@ -1,15 +1,43 @@
 """pytest config - macOS VTK+Qt setup, fixtures."""
 # CRITICAL: macOS VTK+Qt env BEFORE imports
 import os
+import sys
 os.environ.pop('DISPLAY', None)
-os.environ['QT_QPA_PLATFORM'] = 'cocoa'
+# cocoa for the QOpenGLWidget-backed VTK widgets on macOS; elsewhere no display
+# server is assumed. An explicit QT_QPA_PLATFORM (e.g. offscreen in CI) wins.
+os.environ.setdefault('QT_QPA_PLATFORM', 'cocoa' if sys.platform == 'darwin' else 'offscreen')
 
-import sys
+from collections import namedtuple
 from pathlib import Path
 import pytest
 
-# add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+FIXTURES = Path(__file__).parent / "fixtures"
+
+MockWaypoint = namedtuple("MockWaypoint", ["time"])
+
+_LOCATOR = pytest.StashKey()
+_LOCATOR_ERROR = pytest.StashKey()  # why _LOCATOR is None - becomes the skip reason
+
+
+def pytest_sessionstart(session):
+    """warm tesseract plugin paths + resource locator once, before any test."""
+    if session.config.getoption("numprocesses", None) and not hasattr(session.config, "workerinput"):
+        return  # xdist controller runs no tests - each worker warms its own
+    try:
+        # importing the package sets the plugin env vars; _fast_locator then
+        # loads the native modules, which can fail even when it is installed
+        import tesseract_robotics  # noqa: F401
+        from tests._fast_locator import CachedLocator
+    except ImportError as e:
+        session.stash[_LOCATOR] = None
+        session.stash[_LOCATOR_ERROR] = f"tesseract_robotics not usable: {e}"
+        return
+    session.stash[_LOCATOR] = CachedLocator()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """release the shared locator."""
+    session.stash[_LOCATOR] = None
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -25,20 +53,184 @@ def vtk_qt_setup():
 
 @pytest.fixture(scope="session")
 def qapp():
-    """Qt application fixture."""
-    from PySide6.QtWidgets import QApplication
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
+    """Qt application fixture - one QApplication for the whole run."""
+    # not at module level: conftest also serves tests that need no Qt
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    yield QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture(scope="session")
+def offscreen_render_window():
+    """off-screen VTK render window - no NSWindow/dock icon, no main-thread need."""
+    import vtk
+    rw = vtk.vtkRenderWindow()
+    rw.SetOffScreenRendering(1)
+    if hasattr(rw, "SetConnectContextToNSView"):
+        rw.SetConnectContextToNSView(False)
+    yield rw
+    rw.Finalize()
+
+
+@pytest.fixture
+def offscreen_renderer(offscreen_render_window):
+    """renderer bound to the shared off-screen window, detached on teardown."""
+    import vtk
+    renderer = vtk.vtkRenderer()
+    offscreen_render_window.AddRenderer(renderer)
+    yield renderer
+    offscreen_render_window.RemoveRenderer(renderer)
+
+
+@pytest.fixture(scope="session")
+def resource_locator(request):
+    """shared memoizing locator created in pytest_sessionstart."""
+    loc = request.session.stash.get(_LOCATOR, None)
+    if loc is None:
+        pytest.skip(request.session.stash.get(_LOCATOR_ERROR, "tesseract_robotics not installed"))
+    return loc
+
+
+@pytest.fixture(scope="session")
+def make_env(resource_locator):
+    """factory building an initialized Environment, None if init fails.
+
+    URDF/SRDF files are parsed once per path; every call inits a fresh
+    Environment from a clone of the cached SceneGraph (+ cached SRDFModel).
+    """
+    from tesseract_robotics.tesseract_srdf import SRDFModel
+    from tesseract_robotics.tesseract_urdf import parseURDFFile
+
+    graphs = {}
+    srdf_models = {}
+
+    def _make(urdf, srdf=None):
+        from tesseract_robotics.tesseract_environment import Environment
+        urdf = str(urdf)
+        key = (urdf, str(srdf)) if srdf else None
+        try:
+            if urdf not in graphs:
+                graphs[urdf] = parseURDFFile(urdf, resource_locator)
+            if key and key not in srdf_models:
+                model = SRDFModel()
+                model.initFile(graphs[urdf], key[1], resource_locator)
+                srdf_models[key] = model
+        except RuntimeError:
+            return None  # parse error - same as failed init
+
+        env = Environment()
+        if key:
+            ok = env.init(graphs[urdf].clone(), srdf_models[key])
+        else:
+            ok = env.init(graphs[urdf].clone())
+        return env if ok else None
+    return _make
+
+
+@pytest.fixture(scope="session")
+def abb_env(make_env):
+    """ABB IRB2400 environment from fixtures - shared, treat as read-only."""
+    urdf = FIXTURES / "abb_irb2400.urdf"
+    env = make_env(urdf)
+    assert env is not None, f"Failed to load {urdf}"
+    return env
+
+
+@pytest.fixture
+def env(abb_env):
+    """independent clone of abb_env - safe to mutate, URDF parsed only once."""
+    return abb_env.clone()
+
+
+@pytest.fixture(scope="session")
+def env_topology(resource_locator):
+    """ABB IRB2400 environment parsed without meshes - topology/state only.
+
+    Shared, treat as read-only (clone to mutate).
+    """
+    from tesseract_robotics.tesseract_environment import Environment
+    from tests._fast_locator import parse_urdf_no_meshes
+
+    urdf = FIXTURES / "abb_irb2400.urdf"
+    env = Environment()
+    assert env.init(parse_urdf_no_meshes(urdf, resource_locator)), f"Failed to load {urdf}"
+    return env
+
+
+@pytest.fixture(scope="session")
+def abb_mesh_links(abb_env):
+    """names of abb_env links with mesh visuals - plain python tuple."""
+    from tesseract_robotics.tesseract_geometry import GeometryType as GT
+
+    mesh_types = (GT.MESH, GT.CONVEX_MESH, GT.POLYGON_MESH)
+    return tuple(
+        link.getName() for link in abb_env.getSceneGraph().getLinks()
+        if any(v.geometry.getType() in mesh_types for v in link.visual)
+    )
+
+
+@pytest.fixture(scope="session")
+def tesseract_support():
+    """tesseract_support root (has proper package:// resolution)."""
+    tesseract_robotics = pytest.importorskip("tesseract_robotics")
+    support_dir = Path(tesseract_robotics.get_tesseract_support_path())
+    if not support_dir.exists():
+        # Fallback to ws/install for dev mode
+        support_dir = Path(os.environ.get("TESSERACT_SUPPORT_DIR", ""))
+    if not (support_dir / "urdf").exists():
+        pytest.skip("tesseract_support not found")
+    return support_dir
+
+
+@pytest.fixture(scope="session")
+def abb_env_srdf(tesseract_support, make_env):
+    """ABB IRB2400 environment with SRDF (contact managers, kinematic groups)."""
+    urdf = tesseract_support / "urdf" / "abb_irb2400.urdf"
+    srdf = tesseract_support / "urdf" / "abb_irb2400.srdf"
+    if not urdf.exists() or not srdf.exists():
+        pytest.skip("tesseract_support not found")
+    env = make_env(urdf, srdf)
+    assert env is not None, "Failed to init with SRDF"
+    return env
+
+
+@pytest.fixture(scope="session")
+def scene_abb(abb_env, offscreen_render_window):
+    """SceneManager loaded with abb_env - shared, treat as read-only.
+
+    Its renderer is detached from the shared window on teardown.
+    """
+    import vtk
+    from core.scene_manager import SceneManager
+
+    renderer = vtk.vtkRenderer()
+    offscreen_render_window.AddRenderer(renderer)
+    scene = SceneManager(renderer)
+    scene.load_environment(abb_env)
+    yield scene
+    offscreen_render_window.RemoveRenderer(renderer)
+
+
+@pytest.fixture(scope="session")
+def scene_abb_stats(scene_abb):
+    """per-link [(center, n_points)] for scene_abb actors, walked once."""
+    stats = {}
+    for name, actors in scene_abb.link_actors.items():
+        stats[name] = [(a.GetCenter(), a.GetMapper().GetInput().GetNumberOfPoints())
+                       for a in actors]
+    return stats
 
 
 @pytest.fixture
 def sample_trajectory():
-    """sample trajectory for testing player widget."""
-    class MockWaypoint:
-        def __init__(self, time, positions=None):
-            self.time = time
-            self.positions = positions or []
+    """sample trajectory for testing player widget - load_trajectory(**) keyword arrays."""
+    import numpy as np
 
-    return [MockWaypoint(i * 0.033, [0.0] * 6) for i in range(30)]
+    positions = np.zeros((30, 6), dtype=np.float32)
+    times = np.arange(30, dtype=np.float32) * 0.033
+    return {"positions": positions, "times": times}
+
+
+@pytest.fixture(scope="session")
+def mock_trajectory():
+    """10 waypoints with only a .time attribute - shared, immutable tuple."""
+    return tuple(MockWaypoint(i * 0.033) for i in range(10))
@@ -0,0 +1,7 @@
+"""signal tests config - skip the whole package when PySide6 is absent."""
+from importlib.util import find_spec
+
+# find_spec only locates the package, so GUI-less CI skips collection without
+# loading any Qt library; the per-file importorskip guards still catch a
+# PySide6 that is installed but fails to load (e.g. no libGL)
+collect_ignore_glob = [] if find_spec("PySide6") else ["test_*.py"]
@@ -0,0 +1,99 @@
+"""signal tests for ACMEditorWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.acm_editor import ACMEditorWidget, AddACMEntryDialog  # noqa: E402
+
+
+@pytest.fixture(scope="class")
+def acm_editor(qapp):
+    """one ACM editor per class, cleared before each test."""
+    w = ACMEditorWidget()
+    yield w
+    shiboken6.delete(w)
+
+
+class TestACMEditorSignals:
+    """test ACMEditorWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, acm_editor):
+        acm_editor.clear()
+        acm_editor.resolution_slider.setValue(8000)
+
+    @pytest.mark.parametrize("link1, link2, reason", [
+        ("link_a", "link_b", "collision allowed"),
+        ("base", "gripper", "adjacent"),
+    ])
+    def test_entry_added_signal(self, acm_editor, monkeypatch, link1, link2, reason):
+        """test add button emits entry_added with the dialog's (link1, link2, reason)."""
+        # stand in for the modal dialog's exec() + accept
+        monkeypatch.setattr(AddACMEntryDialog, "get_entry", lambda self: (link1, link2, reason))
+
+        spy = QSignalSpy(acm_editor.entry_added)
+        acm_editor.add_btn.click()
+
+        assert spy.count() == 1
+        payload = spy.at(0)
+        assert payload == [link1, link2, reason]
+        assert all(isinstance(arg, str) for arg in payload)
+        assert acm_editor.get_entries() == [(link1, link2, reason)]
+
+    def test_entry_removed_signal(self, acm_editor):
+        """test entry_removed signal emitted when entry removed."""
+        acm_editor.add_entry("link_1", "link_2", "reason")
+
+        acm_editor.table.selectRow(0)
+
+        spy = QSignalSpy(acm_editor.entry_removed)
+        acm_editor._on_remove()
+
+        # verify signal emitted
+        assert spy.count() == 1
+        # verify signal payload: (link1, link2)
+        link1, link2 = spy.at(0)
+        assert link1 == "link_1"
+        assert link2 == "link_2"
+
+    def test_matrix_applied_signal(self, acm_editor):
+        """test matrix_applied signal emitted when apply button clicked."""
+        spy = QSignalSpy(acm_editor.matrix_applied)
+        acm_editor.apply_btn.click()
+
+        # matrix_applied has no payload
+        assert spy.count() == 1
+        assert len(spy.at(0)) == 0
+
+    @pytest.mark.parametrize("resolution", [5000, 8000, 8500])
+    def test_generate_requested_signal(self, acm_editor, resolution):
+        """test generate_requested signal emitted with the int resolution value."""
+        acm_editor.resolution_slider.setValue(resolution)
+
+        spy = QSignalSpy(acm_editor.generate_requested)
+        acm_editor.generate_btn.click()
+
+        # verify signal emitted
+        assert spy.count() == 1
+        # verify signal payload: resolution value
+        (value,) = spy.at(0)
+        assert isinstance(value, int)
+        assert value == resolution
+
+    def test_entry_removed_multiple(self, acm_editor):
+        """test entry_removed signal emitted for each removed entry."""
+        acm_editor.add_entry("l1", "l2", "r1")
+        acm_editor.add_entry("l3", "l4", "r2")
+
+        spy = QSignalSpy(acm_editor.entry_removed)
+
+        acm_editor.table.selectRow(0)
+        acm_editor._on_remove()
+
+        assert spy.count() == 1
+        link1, link2 = spy.at(0)
+        assert link1 == "l1"
+        assert link2 == "l2"
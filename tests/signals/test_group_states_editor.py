@@ -0,0 +1,103 @@
+"""signal tests for GroupStatesEditorWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.group_states_editor import GroupStatesEditorWidget  # noqa: E402
+
+GROUPS = ("g1", "g2", "g3")
+
+
+@pytest.fixture(scope="class")
+def states_editor(qapp):
+    """one group-states editor per class, emptied before each test."""
+    w = GroupStatesEditorWidget()
+    yield w
+    shiboken6.delete(w)
+
+
+class TestGroupStatesEditorSignals:
+    """test GroupStatesEditorWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, states_editor):
+        states_editor.set_states({})
+        states_editor.set_groups([])
+
+    def test_state_added_signal(self, states_editor):
+        """test state_added signal emitted when add button clicked."""
+        states_editor.set_groups(["manipulator"])
+        states_editor.group_combo.setCurrentIndex(0)
+
+        spy = QSignalSpy(states_editor.state_added)
+        states_editor.btn_add.click()
+
+        assert spy.count() == 1
+        group, state, values = spy.at(0)
+        assert group == "manipulator"
+        assert state == "state_1"
+        assert values == {}  # empty values
+
+    def test_state_removed_signal(self, states_editor):
+        """test state_removed signal emitted when remove button clicked."""
+        states_editor.set_groups(["arm"])
+        states_editor.set_states({"arm": {"home": {"j1": 0.0}}})
+        states_editor.table.selectRow(0)
+
+        spy = QSignalSpy(states_editor.state_removed)
+        states_editor.btn_remove.click()
+
+        assert spy.count() == 1
+        group, state = spy.at(0)
+        assert group == "arm"
+        assert state == "home"
+
+    def test_state_applied_signal(self, states_editor):
+        """test state_applied signal emitted when apply button clicked."""
+        states_editor.set_groups(["gripper"])
+        states_editor.set_states({"gripper": {"open": {"j1": 0.5}}})
+        states_editor.table.selectRow(0)
+
+        spy = QSignalSpy(states_editor.state_applied)
+        states_editor.btn_apply.click()
+
+        assert spy.count() == 1
+        group, state = spy.at(0)
+        assert group == "gripper"
+        assert state == "open"
+
+    def test_set_groups_populates_combo(self, states_editor):
+        """test set_groups(emit_signal=False) populates group combo without currentTextChanged."""
+        spy = QSignalSpy(states_editor.group_combo.currentTextChanged)
+        states_editor.set_groups(list(GROUPS), emit_signal=False)
+
+        assert spy.count() == 0
+        assert states_editor.group_combo.count() == 3
+        assert states_editor.group_combo.itemText(1) == GROUPS[1]
+
+    def test_set_states_populates_table(self, states_editor):
+        """test set_states populates table for current group."""
+        states_editor.set_groups(["arm"])
+        states_editor.set_states({"arm": {"home": {"j1": 0.0}, "ready": {"j1": 1.0}}})
+
+        assert states_editor.table.rowCount() == 2
+
+    @pytest.mark.parametrize("emit_signal", [True, False])
+    def test_set_groups_refreshes_table(self, states_editor, emit_signal):
+        """test set_groups after set_states shows the new current group's states."""
+        states_editor.set_states({"arm": {"home": {"j1": 0.0}, "ready": {"j1": 1.0}}})
+        states_editor.set_groups(["arm"], emit_signal=emit_signal)
+
+        assert states_editor.table.rowCount() == 2
+
+    def test_get_states_returns_dict(self, states_editor):
+        """test get_states returns current states dict."""
+        states = {"arm": {"home": {"j1": 0.0}}}
+        states_editor.set_groups(["arm"])
+        states_editor.set_states(states)
+
+        result = states_editor.get_states()
+        assert result == states
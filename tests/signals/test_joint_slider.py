@@ -0,0 +1,115 @@
+"""signal tests for JointSliderWidget."""
+import math
+
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.joint_slider import JointSliderWidget  # noqa: E402
+
+RAD30 = math.radians(30.0)
+RAD45 = math.radians(45.0)
+# name -> (lower, upper, initial), shared by the fixture and the limit checks
+JOINTS = {"j1": (-1.0, 1.0, 0.0), "j2": (-2.0, 2.0, 0.0)}
+
+
+@pytest.fixture(scope="class")
+def joint_slider(qapp):
+    """one two-joint slider widget per class, zeroed before each test."""
+    w = JointSliderWidget()
+    w.set_joints(JOINTS)
+    yield w
+    shiboken6.delete(w)
+
+
+class TestJointSliderSignals:
+    """test JointSliderWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, joint_slider):
+        for slider in joint_slider.sliders.values():
+            slider.set_value(0.0)  # set_value never emits
+
+    @pytest.mark.parametrize("attr, input_val, expected, tol", [
+        # spinbox displays degrees
+        ("spinbox", 30.0, RAD30, 0.001),
+        ("spinbox", 45.0, RAD45, 0.001),
+        # slider range is 0-1000: 750 is 3/4 of -1.0..1.0 = 0.5
+        ("slider", 750, 0.5, 0.01),
+    ], ids=["spinbox_30deg", "spinbox_45deg", "slider_750"])
+    def test_joint_value_changed(self, joint_slider, attr, input_val, expected, tol):
+        """test jointValueChanged emitted with (name, radians) from spinbox or slider."""
+        spy = QSignalSpy(joint_slider.jointValueChanged)
+        getattr(joint_slider.sliders["j1"], attr).setValue(input_val)
+
+        # verify signal emitted
+        assert spy.count() == 1
+        # verify signal payload: (name, value in radians)
+        name, value = spy.at(0)
+        assert name == "j1"
+        assert value == pytest.approx(expected, abs=tol)
+
+    def test_joint_values_changed_signal_emission(self, joint_slider):
+        """test jointValuesChanged signal emitted with dict of all joint values."""
+        spy = QSignalSpy(joint_slider.jointValuesChanged)
+        # Spinbox displays degrees, set 30 degrees
+        joint_slider.sliders["j1"].spinbox.setValue(30.0)
+
+        # verify signal emitted
+        assert spy.count() == 1
+        # verify signal payload: dict with all joint values in radians
+        (values,) = spy.at(0)
+        assert isinstance(values, dict)
+        assert "j1" in values
+        assert "j2" in values
+        assert values["j1"] == pytest.approx(RAD30, abs=0.001)
+        assert values["j2"] == 0.0
+
+    def test_multiple_joint_changes(self, joint_slider):
+        """test multiple joints trigger individual signals."""
+        spy = QSignalSpy(joint_slider.jointValueChanged)
+
+        joint_slider.sliders["j1"].spinbox.setValue(0.5)
+        joint_slider.sliders["j2"].spinbox.setValue(-1.0)
+
+        assert spy.count() == 2
+        assert spy.at(0)[0] == "j1"
+        assert spy.at(1)[0] == "j2"
+
+    def test_zero_all_emits_joint_values_changed(self, joint_slider):
+        """test zero all button emits jointValuesChanged signal."""
+        joint_slider.sliders["j1"].set_value(0.5)
+        joint_slider.sliders["j2"].set_value(1.0)
+
+        spy = QSignalSpy(joint_slider.jointValuesChanged)
+        joint_slider.btn_zero.click()
+
+        assert spy.count() == 1
+        (values,) = spy.at(0)
+        assert values["j1"] == 0.0
+        assert values["j2"] == 0.0
+
+    def test_random_emits_joint_values_changed(self, joint_slider):
+        """test random button emits jointValuesChanged signal."""
+        spy = QSignalSpy(joint_slider.jointValuesChanged)
+        joint_slider.btn_random.click()
+
+        assert spy.count() == 1
+        (values,) = spy.at(0)
+        assert values.keys() == JOINTS.keys()
+        # verify values are within limits
+        for name, (lower, upper, _) in JOINTS.items():
+            assert lower <= values[name] <= upper
+
+    def test_set_value_programmatic_no_signal(self, joint_slider):
+        """test set_value() does not emit signal (updating flag prevents it)."""
+        spy = QSignalSpy(joint_slider.sliders["j1"].valueChanged)
+
+        # set_value uses _updating flag to prevent signal
+        joint_slider.sliders["j1"].set_value(0.5)
+
+        # no signal should be emitted
+        assert spy.count() == 0
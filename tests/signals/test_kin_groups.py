@@ -0,0 +1,140 @@
+"""signal tests for KinematicGroupsEditorWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.kinematic_groups_editor import KinematicGroupsEditorWidget  # noqa: E402
+
+
+@pytest.fixture(scope="class")
+def kin_groups(qapp):
+    """one kinematic groups editor per class, cleared before each test."""
+    w = KinematicGroupsEditorWidget()
+    yield w
+    shiboken6.delete(w)
+
+
+def _setup_chain(w):
+    w.set_links(["base_link", "link_1", "link_2", "tool0"])
+    w.baseLinkNameComboBox.setCurrentText("base_link")
+    w.tipLinkNameComboBox.setCurrentText("tool0")
+
+
+def _setup_joints(w):
+    w.set_joints(["joint_1", "joint_2", "joint_3"])
+    for joint in ("joint_1", "joint_2"):
+        w.jointComboBox.setCurrentText(joint)
+        w.addJointPushButton.click()
+
+
+def _setup_links(w):
+    w.set_links(["base_link", "link_1", "link_2"])
+    for link in ("link_1", "link_2"):
+        w.linkComboBox.setCurrentText(link)
+        w.addLinkPushButton.click()
+
+
+class TestKinematicGroupsEditorSignals:
+    """test KinematicGroupsEditorWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, kin_groups):
+        kin_groups.groupNameLineEdit.clear()
+        kin_groups.jointListWidget.clear()
+        kin_groups.linkListWidget.clear()
+        kin_groups.set_links([])
+        kin_groups.set_joints([])
+        kin_groups.kinGroupTabWidget.setCurrentIndex(0)
+
+    @pytest.mark.parametrize("tab, setup, name, kind, payload", [
+        (0, _setup_chain, "test_group", "chain", ("base_link", "tool0")),
+        (1, _setup_joints, "joints_group", "joints", ["joint_1", "joint_2"]),
+        (2, _setup_links, "links_group", "links", ["link_1", "link_2"]),
+    ], ids=["chain", "joints", "links"])
+    def test_group_added_signal(self, kin_groups, tab, setup, name, kind, payload):
+        """test group_added signal emitted with (name, kind, data) for each group tab."""
+        setup(kin_groups)
+        kin_groups.groupNameLineEdit.setText(name)
+        kin_groups.kinGroupTabWidget.setCurrentIndex(tab)
+
+        spy = QSignalSpy(kin_groups.group_added)
+        kin_groups.addGroupPushButton.click()
+
+        assert spy.count() == 1
+        assert spy.at(0) == [name, kind, payload]
+
+    def test_group_removed_signal(self, kin_groups):
+        """test group_removed signal emitted when remove clicked."""
+        kin_groups.groupNameLineEdit.setText("group_to_remove")
+
+        spy = QSignalSpy(kin_groups.group_removed)
+        kin_groups.removeGroupPushButton.click()
+
+        assert spy.count() == 1
+        assert spy.at(0)[0] == "group_to_remove"
+
+    def test_group_modified_signal(self, kin_groups):
+        """test group_modified signal emitted when apply clicked."""
+        spy = QSignalSpy(kin_groups.group_modified)
+        kin_groups.applyPushButton.click()
+
+        assert spy.count() == 1
+        assert len(spy.at(0)) == 0  # No payload
+
+    def test_add_joint_to_list(self, kin_groups):
+        """test adding joint to list via button."""
+        kin_groups.set_joints(["j1", "j2", "j3"])
+        kin_groups.kinGroupTabWidget.setCurrentIndex(1)  # JOINTS tab
+
+        kin_groups.jointComboBox.setCurrentText("j2")
+        kin_groups.addJointPushButton.click()
+
+        assert kin_groups.jointListWidget.count() == 1
+        assert kin_groups.jointListWidget.item(0).text() == "j2"
+
+    def test_remove_joint_from_list(self, kin_groups):
+        """test removing joint from list via button."""
+        kin_groups.set_joints(["j1", "j2"])
+        kin_groups.kinGroupTabWidget.setCurrentIndex(1)
+
+        # Add then remove
+        kin_groups.jointComboBox.setCurrentText("j1")
+        kin_groups.addJointPushButton.click()
+        kin_groups.jointListWidget.setCurrentRow(0)
+        kin_groups.removeJointPushButton.click()
+
+        assert kin_groups.jointListWidget.count() == 0
+
+    def test_add_link_to_list(self, kin_groups):
+        """test adding link to list via button."""
+        kin_groups.set_links(["link_1", "link_2"])
+        kin_groups.kinGroupTabWidget.setCurrentIndex(2)  # LINKS tab
+
+        kin_groups.linkComboBox.setCurrentText("link_1")
+        kin_groups.addLinkPushButton.click()
+
+        assert kin_groups.linkListWidget.count() == 1
+        assert kin_groups.linkListWidget.item(0).text() == "link_1"
+
+    def test_no_duplicate_joints(self, kin_groups):
+        """test same joint cannot be added twice."""
+        kin_groups.set_joints(["j1"])
+        kin_groups.kinGroupTabWidget.setCurrentIndex(1)
+
+        kin_groups.jointComboBox.setCurrentText("j1")
+        kin_groups.addJointPushButton.click()
+        kin_groups.addJointPushButton.click()  # Try adding again
+
+        assert kin_groups.jointListWidget.count() == 1
+
+    def test_empty_group_name_no_signal(self, kin_groups):
+        """test no signal emitted when group name is empty."""
+        kin_groups.groupNameLineEdit.setText("")  # Empty name
+
+        spy = QSignalSpy(kin_groups.group_added)
+        kin_groups.addGroupPushButton.click()
+
+        assert spy.count() == 0  # No signal emitted
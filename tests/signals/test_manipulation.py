@@ -0,0 +1,101 @@
+"""signal tests for ManipulationWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.manipulation_widget import ManipulationWidget  # noqa: E402
+
+GROUPS = ("group1", "group2", "group3")
+STATES = ("state1", "state2")
+LINKS = ("link1", "link2", "link3")
+
+
+@pytest.fixture(scope="class")
+def manip(qapp):
+    """one ManipulationWidget (embeds FKIKWidget) per class, combos emptied before each test."""
+    w = ManipulationWidget()
+    yield w
+    shiboken6.delete(w)
+
+
+class TestManipulationWidgetSignals:
+    """test ManipulationWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, manip):
+        manip.set_groups([])
+        manip.set_states([])
+        manip.set_links([])
+
+    def test_group_changed_signal(self, manip):
+        """test groupChanged signal emitted when group selection changes."""
+        manip.set_groups(["arm", "gripper"])
+
+        spy = QSignalSpy(manip.groupChanged)
+        manip.group_combo_box.setCurrentIndex(1)  # Select "gripper"
+
+        assert spy.count() == 1
+        assert spy.at(0)[0] == "gripper"
+
+    def test_reload_requested_signal(self, manip):
+        """test reloadRequested signal emitted when reload button clicked."""
+        spy = QSignalSpy(manip.reloadRequested)
+        manip.reload_push_button.click()
+
+        assert spy.count() == 1
+
+    def test_state_apply_requested_signal(self, manip):
+        """test stateApplyRequested signal emitted when apply button clicked."""
+        manip.set_states(["home", "ready"])
+        manip.state_selector_combo.setCurrentIndex(1)  # Select "ready"
+
+        spy = QSignalSpy(manip.stateApplyRequested)
+        manip.apply_state_button.click()
+
+        assert spy.count() == 1
+        assert spy.at(0)[0] == "ready"
+
+    def test_joint_values_changed_signal(self, manip):
+        """test jointValuesChanged signal emitted when joint slider values change."""
+        # Only if FKIKWidget is available
+        if manip.fkik_widget is None:
+            pytest.skip("FKIKWidget not available")
+
+        manip.set_joint_limits({"joint_1": (-1.0, 1.0, 0.0)})
+
+        spy = QSignalSpy(manip.jointValuesChanged)
+
+        # Change joint value via spinbox (in degrees, 30 deg = ~0.5236 rad)
+        manip.fkik_widget.joint_slider.sliders["joint_1"].spinbox.setValue(30.0)
+
+        assert spy.count() >= 1
+        (values,) = spy.at(0)
+        assert isinstance(values, dict)
+        assert "joint_1" in values
+
+    def test_setters_populate_combos(self, manip):
+        """test set_groups/set_states/set_links populate their combo boxes."""
+        manip.set_groups(list(GROUPS))
+        assert manip.group_combo_box.count() == 3
+        assert manip.group_combo_box.itemText(0) == GROUPS[0]
+        assert manip.group_combo_box.itemText(2) == GROUPS[2]
+
+        manip.set_states(list(STATES))
+        assert manip.state_combo_box.count() == 2
+        assert manip.state_selector_combo.count() == 2
+        assert manip.state_combo_box.itemText(0) == STATES[0]
+
+        manip.set_links(list(LINKS))
+        assert manip.working_frame_combo_box.count() == 3
+        assert manip.tcp_combo_box.count() == 3
+        assert manip.tcp_combo_box.itemText(1) == LINKS[1]
+
+    def test_current_group_returns_selected(self, manip):
+        """test current_group returns selected group name."""
+        manip.set_groups(["arm", "leg"])
+        manip.group_combo_box.setCurrentIndex(1)
+
+        assert manip.current_group() == "leg"
@@ -0,0 +1,133 @@
+"""signal tests for SceneTreeWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+from PySide6.QtWidgets import QMenu, QTreeWidgetItem  # noqa: E402
+
+import widgets.scene_tree  # noqa: E402
+from widgets.scene_tree import SceneTreeWidget  # noqa: E402
+
+USER_ROLE = Qt.ItemDataRole.UserRole
+CHECKABLE = Qt.ItemFlag.ItemIsUserCheckable
+CHECKED = Qt.CheckState.Checked
+UNCHECKED = Qt.CheckState.Unchecked
+
+
+class _PickMenu(QMenu):
+    """context menu that triggers its ``pick`` action instead of blocking in exec_."""
+
+    pick = "Show Frame"
+
+    def exec_(self, *args):
+        action = next(a for a in self.actions() if a.text() == self.pick)
+        action.trigger()
+        return action
+
+
+@pytest.fixture(scope="class")
+def scene_tree(qapp):
+    """one tree widget per class, emptied before each test."""
+    w = SceneTreeWidget()
+    yield w
+    shiboken6.delete(w)
+
+
+@pytest.fixture(scope="class")
+def link_template(qapp):
+    """checkable, checked link item - clone() it instead of building items per test."""
+    item = QTreeWidgetItem()
+    item.setData(0, USER_ROLE, ("link", ""))
+    item.setFlags(item.flags() | CHECKABLE)
+    item.setCheckState(0, CHECKED)
+    return item
+
+
+def _add_link(tree, template, name, checked=True):
+    """clone the template as link ``name`` and attach it to ``tree``."""
+    item = template.clone()
+    item.setText(0, name)
+    item.setData(0, USER_ROLE, ("link", name))
+    if not checked:
+        item.setCheckState(0, UNCHECKED)
+    tree.addTopLevelItem(item)
+    return item
+
+
+class TestSceneTreeSignals:
+    """test SceneTreeWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, scene_tree):
+        scene_tree.tree.clear()
+
+    def test_link_selected_signal(self, scene_tree, link_template):
+        """test linkSelected signal emitted when tree item selected."""
+        item = _add_link(scene_tree.tree, link_template, "base_link")
+
+        spy = QSignalSpy(scene_tree.linkSelected)
+        scene_tree.tree.setCurrentItem(item)
+
+        assert spy.count() == 1
+        assert spy.at(0)[0] == "base_link"
+
+    @pytest.mark.parametrize("initial, toggled, visible", [
+        (CHECKED, UNCHECKED, False),
+        (UNCHECKED, CHECKED, True),
+    ], ids=["hide", "show"])
+    def test_link_visibility_changed_signal(self, scene_tree, link_template, initial, toggled, visible):
+        """test linkVisibilityChanged signal emitted when checkbox toggled."""
+        item = _add_link(scene_tree.tree, link_template, "test_link", checked=initial == CHECKED)
+
+        spy = QSignalSpy(scene_tree.linkVisibilityChanged)
+        item.setCheckState(0, toggled)
+
+        # verify signal emitted
+        assert spy.count() == 1
+        # verify signal payload: (link_name, visible)
+        name, shown = spy.at(0)
+        assert name == "test_link"
+        assert shown is visible
+
+    @pytest.mark.parametrize("link", ["test_link", "another_link"])
+    def test_link_frame_toggled_signal(self, scene_tree, link_template, monkeypatch, link):
+        """test linkFrameToggled emitted by the context menu's Show Frame action."""
+        item = _add_link(scene_tree.tree, link_template, link)
+        monkeypatch.setattr(widgets.scene_tree, "QMenu", _PickMenu)
+
+        spy = QSignalSpy(scene_tree.linkFrameToggled)
+        scene_tree._on_context_menu(scene_tree.tree.visualItemRect(item).center())
+
+        assert spy.count() == 1
+        name, shown = spy.at(0)
+        assert name == link
+        assert shown is True
+
+    def test_link_selected_signal_payload(self, scene_tree, link_template):
+        """test linkSelected signal payload is string link name."""
+        item = _add_link(scene_tree.tree, link_template, "gripper_link")
+
+        spy = QSignalSpy(scene_tree.linkSelected)
+        scene_tree.tree.setCurrentItem(item)
+
+        assert spy.count() == 1
+        (name,) = spy.at(0)
+        assert isinstance(name, str)
+        assert name == "gripper_link"
+
+    def test_no_signal_on_joint_selection(self, scene_tree):
+        """test linkSelected NOT emitted when joint item selected."""
+        # create joint item (not link)
+        item = QTreeWidgetItem()
+        item.setText(0, "joint1")
+        item.setData(0, USER_ROLE, ("joint", "joint1"))
+        scene_tree.tree.addTopLevelItem(item)
+
+        spy = QSignalSpy(scene_tree.linkSelected)
+        scene_tree.tree.setCurrentItem(item)
+
+        # should not emit linkSelected for joint item
+        assert spy.count() == 0
@@ -0,0 +1,60 @@
+"""signal tests for TaskComposerWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.task_composer_widget import TaskComposerWidget  # noqa: E402
+
+
+@pytest.fixture(scope="class")
+def task_composer(qapp):
+    """one task composer per class, log cleared before each test."""
+    w = TaskComposerWidget()
+    yield w
+    shiboken6.delete(w)
+
+
+class TestTaskComposerSignals:
+    """test TaskComposerWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, task_composer):
+        task_composer.clear_log()
+
+    def test_execute_requested_signal(self, task_composer):
+        """test execute_requested signal emitted when run button clicked."""
+        spy = QSignalSpy(task_composer.execute_requested)
+        task_composer.task_run_push_button.click()
+
+        assert spy.count() == 1
+
+    def test_log_appends_text(self, task_composer):
+        """test log method appends text to output."""
+        task_composer.log("Test message 1")
+        task_composer.log("Test message 2")
+
+        text = task_composer.log_output.toPlainText()
+        assert "Test message 1" in text
+        assert "Test message 2" in text
+
+    def test_clear_log_clears_output(self, task_composer):
+        """test clear_log method clears output."""
+        task_composer.log("Some message")
+        assert not task_composer.log_output.document().isEmpty()
+
+        task_composer.clear_log()
+        assert task_composer.log_output.document().isEmpty()
+
+    def test_has_config_tab(self, task_composer):
+        """test widget has config tab with combo boxes."""
+        assert task_composer.tab_widget.count() == 2
+        assert task_composer.tab_widget.tabText(0) == "Config"
+        assert task_composer.tab_widget.tabText(1) == "Logs"
+
+    def test_has_executor_combo(self, task_composer):
+        """test config tab has executor combo box."""
+        assert hasattr(task_composer, 'executor_combo_box')
+        assert hasattr(task_composer, 'task_combo_box')
@@ -0,0 +1,88 @@
+"""signal tests for TCPEditorWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.tcp_editor import TCPEditorWidget  # noqa: E402
+
+LINKS = ("base_link", "tool0", "flange")
+
+
+@pytest.fixture(scope="class")
+def tcp_editor(qapp):
+    """one TCP editor per class, reset before each test."""
+    w = TCPEditorWidget()
+    yield w
+    shiboken6.delete(w)
+
+
+class TestTCPEditorSignals:
+    """test TCPEditorWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, tcp_editor):
+        tcp_editor.set_links([])
+        tcp_editor.reset_btn.click()
+
+    def test_tcp_changed_signal(self, tcp_editor):
+        """test tcp_changed signal emitted when link selection changes."""
+        tcp_editor.set_links(list(LINKS))
+
+        spy = QSignalSpy(tcp_editor.tcp_changed)
+        tcp_editor.link_combo.setCurrentIndex(1)
+
+        assert spy.count() == 1
+        assert spy.at(0)[0] == "tool0"
+
+    def test_offset_changed_signal(self, tcp_editor):
+        """test offset_changed signal emitted when offset values change."""
+        spy = QSignalSpy(tcp_editor.offset_changed)
+        tcp_editor.offset_editor.x_spin.setValue(0.1)
+
+        assert spy.count() >= 1
+        assert spy.at(0)[0] == 0.1  # x value
+
+    def test_set_links_populates_combo(self, tcp_editor):
+        """test set_links populates link combo."""
+        tcp_editor.set_links(list(LINKS))
+
+        assert tcp_editor.link_combo.count() == 3
+        assert tcp_editor.link_combo.itemText(2) == LINKS[2]
+
+    def test_set_tcp_selects_link(self, tcp_editor):
+        """test set_tcp selects the specified link."""
+        tcp_editor.set_links(list(LINKS))
+        tcp_editor.set_tcp("flange")
+
+        assert tcp_editor.link_combo.currentText() == "flange"
+
+    @pytest.mark.parametrize("spin, index, value", [
+        ("x_spin", 0, 0.1),
+        ("y_spin", 1, 0.2),
+        ("z_spin", 2, 0.3),
+    ], ids=["x", "y", "z"])
+    def test_get_offset_returns_tuple(self, tcp_editor, spin, index, value):
+        """test get_offset returns the 6-tuple with each spin at its own slot."""
+        expected = list(tcp_editor.get_offset())
+        expected[index] = value
+        getattr(tcp_editor.offset_editor, spin).setValue(value)
+
+        assert tcp_editor.get_offset() == tuple(expected)
+
+    def test_reset_clears_offset(self, tcp_editor):
+        """test reset button clears all offset values."""
+        tcp_editor.offset_editor.x_spin.setValue(0.5)
+        tcp_editor.offset_editor.roll_spin.setValue(45.0)
+
+        spy = QSignalSpy(tcp_editor.offset_changed)
+        tcp_editor.reset_btn.click()
+
+        offset = tcp_editor.get_offset()
+        assert all(v == 0.0 for v in offset)
+        # one emission for the whole reset, carrying the zeroed offset
+        assert spy.count() == 1
+        assert tuple(spy.at(0)) == offset
+        assert tcp_editor.offset_editor.roll_slider.value() == 0
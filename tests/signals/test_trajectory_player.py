@@ -0,0 +1,68 @@
+"""signal tests for TrajectoryPlayerWidget."""
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets")
+
+import shiboken6  # noqa: E402
+from PySide6.QtTest import QSignalSpy  # noqa: E402
+
+from widgets.trajectory_player import TrajectoryPlayerWidget  # noqa: E402
+
+
+@pytest.fixture(scope="class")
+def player(qapp, mock_trajectory):
+    """one player per class, reset to stopped at frame 0 before each test."""
+    w = TrajectoryPlayerWidget()
+    w.load_trajectory(mock_trajectory)
+    yield w
+    shiboken6.delete(w)
+
+
+class TestTrajectoryPlayerSignals:
+    """test TrajectoryPlayerWidget signals."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, player):
+        player.btn_stop.click()
+
+    @pytest.mark.parametrize("action, expected", [
+        (lambda p: p.slider.setValue(5), [5]),
+        (lambda p: p.set_frame(3), [3]),
+        (lambda p: [p.slider.setValue(v) for v in (2, 4, 6)], [2, 4, 6]),
+    ], ids=["slider", "set_frame", "slider_sequence"])
+    def test_frame_changed_signal(self, player, action, expected):
+        """test frameChanged emits one int frame per slider move or set_frame call."""
+        spy = QSignalSpy(player.frameChanged)
+        action(player)
+
+        frames = [spy.at(i)[0] for i in range(spy.count())]
+        assert frames == expected
+        assert all(isinstance(f, int) for f in frames)
+
+    @pytest.mark.parametrize("buttons, expected", [
+        (["btn_play"], ["playing"]),
+        (["btn_play", "btn_play"], ["playing", "paused"]),  # second click toggles to pause
+        (["btn_stop"], ["stopped"]),
+    ], ids=["play", "pause", "stop"])
+    def test_state_changed_signal(self, player, buttons, expected):
+        """test stateChanged emits one state per play/pause/stop click."""
+        spy = QSignalSpy(player.stateChanged)
+        for button in buttons:
+            getattr(player, button).click()
+
+        assert [spy.at(i)[0] for i in range(spy.count())] == expected
+
+    def test_stop_emits_frame_zero(self, player):
+        """test stop button resets frame to 0 and emits signal."""
+        player.set_frame(5)
+
+        frame_spy = QSignalSpy(player.frameChanged)
+        state_spy = QSignalSpy(player.stateChanged)
+
+        player.btn_stop.click()
+
+        # should emit frameChanged(0) and stateChanged("stopped")
+        assert frame_spy.count() >= 1
+        assert frame_spy.at(frame_spy.count() - 1)[0] == 0
+        assert state_spy.count() == 1
+        assert state_spy.at(0)[0] == "stopped"
@@ -1,10 +1,13 @@
 """Smoke tests - examples must complete without error."""
-import pytest
+import subprocess
 import sys
+import warnings
 from pathlib import Path
 
-# Add parent to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
 
 
 # Skip markers for optional deps
@@ -15,28 +18,51 @@ tesseract_available = pytest.mark.skipif(
 )
 
 
-class TestImports:
-    """Test all modules import cleanly."""
-
-    def test_import_core(self):
-        try:
-            from core.scene_manager import SceneManager
-            from core.camera_control import CameraController, ViewMode
-        except ImportError as e:
-            if "vtk" in str(e) or "tesseract" in str(e) or "dylib" in str(e):
-                pytest.skip(f"dependency not available: {e}")
-            raise
-
-    def test_import_state_manager(self):
-        from core.state_manager import StateManager
-
-    def test_import_contact_viz(self):
-        try:
-            from core.contact_viz import ContactVisualizer
-        except ImportError as e:
-            if "vtk" in str(e):
-                pytest.skip("vtk not installed")
-            raise
+# a failed child import skips only when its exception line names one of these
+OPTIONAL_DEPS = ("vtk", "tesseract_robotics", "PySide6", "pyqtgraph", "loguru", "dylib")
+# cold imports slower than this warn - reported, never failed (-n auto jitter)
+IMPORT_BUDGET_S = 10.0
+# marks the child's timing line, so prints during the import can't be misread
+IMPORT_TIME_PREFIX = "IMPORT_TIME_S="
+
+
+@pytest.mark.parametrize("mod", [
+    "core.scene_manager",
+    "core.camera_control",
+    "core.state_manager",
+    "core.contact_viz",
+    "widgets.info_panel",
+    "widgets.plot_widget",
+    "widgets.joint_slider",
+    "widgets.scene_tree",
+    "widgets.render_widget",
+    "app",
+])
+def test_module_imports_cleanly(mod, request):
+    """Test module imports in a fresh interpreter (true cold-start, no shared cache).
+
+    The cold-import time is kept in the test's user_properties as import_s.
+    """
+    code = ("import time; t = time.perf_counter(); "
+            f"import {mod}; print('{IMPORT_TIME_PREFIX}%f' % (time.perf_counter() - t))")
+    r = subprocess.run([sys.executable, "-c", code],
+                       cwd=PROJECT_ROOT, capture_output=True, timeout=60)
+    if r.returncode:
+        stderr = r.stderr.decode()
+        # only the exception line - the traceback carries paths and source lines
+        exc = stderr.strip().splitlines()[-1] if stderr.strip() else ""
+        if exc.startswith(("ModuleNotFoundError", "ImportError")) and any(
+                dep in exc for dep in OPTIONAL_DEPS):
+            pytest.skip(f"dependency not available: {exc}")
+        pytest.fail(stderr)
+
+    timing = [line for line in r.stdout.decode().splitlines()
+              if line.startswith(IMPORT_TIME_PREFIX)]
+    assert timing, f"import {mod} printed no timing line"
+    elapsed = float(timing[-1][len(IMPORT_TIME_PREFIX):])
+    request.node.user_properties.append(("import_s", elapsed))
+    if elapsed >= IMPORT_BUDGET_S:
+        warnings.warn(f"cold import {mod} took {elapsed:.2f}s (budget {IMPORT_BUDGET_S}s)")
 
 
 class TestExamples:
@@ -103,24 +129,30 @@ class TestStateManager:
 class TestTrajectoryPlayer:
     """Test trajectory player widget."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-        app = QApplication.instance() or QApplication([])
-        yield app
-
     def test_create_player(self, qapp):
         from widgets.trajectory_player import TrajectoryPlayerWidget
         w = TrajectoryPlayerWidget()
         assert w._frame_count == 0
         assert w.get_frame() == 0
 
-    def test_load_trajectory(self, qapp):
-        import numpy as np
+    def test_load_trajectory(self, qapp, sample_trajectory):
+        from widgets.trajectory_player import TrajectoryPlayerWidget
+
+        w = TrajectoryPlayerWidget()
+        # positions (N, DOF) and times (N,) arrays
+        w.load_trajectory(**sample_trajectory)
+        assert w._frame_count == 30
+        assert w.get_frame() == 0
+
+        w.set_frame(10)
+        assert w.get_waypoint().shape == (6,)
+        assert w.time_label.text() == "0.330s"
+
+    def test_load_trajectory_waypoint_list(self, qapp):
         from widgets.trajectory_player import TrajectoryPlayerWidget
 
         w = TrajectoryPlayerWidget()
-        # Fake trajectory: list of (positions, timestamp) tuples
+        # Legacy trajectory: list of (positions, timestamp) tuples
         traj = [
             (np.array([0.0, 0.0, 0.0]), 0.0),
             (np.array([0.1, 0.2, 0.3]), 0.5),
@@ -134,12 +166,6 @@ class TestTrajectoryPlayer:
 class TestInfoPanel:
     """Test robot info panel."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-        app = QApplication.instance() or QApplication([])
-        yield app
-
     def test_create_panel(self, qapp):
         from widgets.info_panel import RobotInfoPanel
         p = RobotInfoPanel()
@@ -157,42 +183,46 @@ class TestInfoPanel:
         p.update_joint_values({"j1": 1.5, "j2": -0.5})
 
 
+# (K, 3, 3) rotation matrices and their expected (K, 3) roll, pitch, yaw
+RPY_CASES = np.stack([
+    np.eye(3),
+    # 90 deg rotation about Z
+    np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]], dtype=float),
+    # 90 deg rotation about X
+    np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]], dtype=float),
+    # 90 deg rotation about Y - gimbal lock
+    np.array([[0, 0, 1], [0, 1, 0], [-1, 0, 0]], dtype=float),
+])
+RPY_EXPECTED = np.array([
+    [0.0, 0.0, 0.0],
+    [0.0, 0.0, np.pi / 2],
+    [np.pi / 2, 0.0, 0.0],
+    [0.0, np.pi / 2, 0.0],
+])
+
+
 class TestRotationConversion:
     """Test rotation matrix to RPY conversion."""
 
-    def test_identity(self):
-        import numpy as np
+    @pytest.mark.parametrize("i", range(len(RPY_CASES)),
+                             ids=["identity", "yaw_90", "roll_90", "pitch_90"])
+    def test_rpy(self, i):
         from widgets.info_panel import rotation_matrix_to_rpy
 
-        R = np.eye(3)
-        roll, pitch, yaw = rotation_matrix_to_rpy(R)
-        assert abs(roll) < 1e-6
-        assert abs(pitch) < 1e-6
-        assert abs(yaw) < 1e-6
+        roll, pitch, yaw = rotation_matrix_to_rpy(RPY_CASES[i])
+        assert np.allclose([roll, pitch, yaw], RPY_EXPECTED[i], atol=1e-6)
 
-    def test_90_deg_yaw(self):
-        import numpy as np
+    def test_batched(self):
         from widgets.info_panel import rotation_matrix_to_rpy
 
-        # 90 deg rotation about Z
-        R = np.array([
-            [0, -1, 0],
-            [1, 0, 0],
-            [0, 0, 1],
-        ], dtype=float)
-        roll, pitch, yaw = rotation_matrix_to_rpy(R)
-        assert abs(yaw - np.pi / 2) < 1e-6
+        roll, pitch, yaw = rotation_matrix_to_rpy(RPY_CASES)
+        assert roll.shape == (len(RPY_CASES),)
+        assert np.allclose(np.stack([roll, pitch, yaw], axis=-1), RPY_EXPECTED, atol=1e-6)
 
 
 class TestPlotWidget:
     """Test plot widget without display."""
 
-    @pytest.fixture
-    def qapp(self):
-        from PySide6.QtWidgets import QApplication
-        app = QApplication.instance() or QApplication([])
-        yield app
-
     def test_create_plot_widget(self, qapp):
         pytest.importorskip("pyqtgraph", reason="pyqtgraph not installed")
         from widgets.plot_widget import PlotWidget
@@ -1,25 +1,38 @@
 """Test URDF loading and core functionality."""
+import math
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-FIXTURES = Path(__file__).parent / "fixtures"
-
+# importorskip("tesseract_robotics") only loads the pure-Python top level; the
+# native submodules can still fail (e.g. a libstdc++ mismatch) - skip, not error
+try:
+    import tesseract_robotics
+    from tesseract_robotics.tesseract_collision import (
+        ContactRequest, ContactResultMap, ContactResultVector, ContactTestType
+    )
+    from tesseract_robotics.tesseract_common import CollisionMarginData
+    import tesseract_robotics.tesseract_environment  # noqa: F401 - the env fixtures need it
+    from tesseract_robotics.tesseract_geometry import GeometryType as GT
+    from tesseract_robotics.tesseract_scene_graph import JointType
+except ImportError as e:
+    pytest.skip(f"tesseract_robotics not usable: {e}", allow_module_level=True)
+# SceneManager and ManipulationWidget need VTK and QtWidgets
+pytest.importorskip("vtk")
+pytest.importorskip("PySide6.QtWidgets")
 
-def test_urdf_loads():
-    """Test basic URDF loading."""
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
+from core.scene_manager import SceneManager  # noqa: E402
+from widgets.manipulation_widget import ManipulationWidget  # noqa: E402
 
-    urdf = FIXTURES / "abb_irb2400.urdf"
-    env = Environment()
-    loc = GeneralResourceLocator()
+JOINT_NAMES = tuple(f"joint_{i}" for i in range(1, 7))  # ABB IRB2400 active joints
 
-    assert env.init(str(urdf), loc), f"Failed to load {urdf}"
 
-    sg = env.getSceneGraph()
-    links = [l.getName() for l in sg.getLinks()]
-    joints = [j.getName() for j in sg.getJoints()]
+def test_urdf_loads(env_topology):
+    """Test basic URDF loading."""
+    sg = env_topology.getSceneGraph()
+    links = [link.getName() for link in sg.getLinks()]
+    joints = [joint.getName() for joint in sg.getJoints()]
 
     assert "base_link" in links
     assert "tool0" in links
@@ -27,41 +40,24 @@ def test_urdf_loads():
     assert len(joints) == 8
 
 
-def test_joint_limits():
+def test_joint_limits(env_topology):
     """Test joint limits are parsed correctly."""
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-    from tesseract_robotics.tesseract_scene_graph import JointType
-
-    urdf = FIXTURES / "abb_irb2400.urdf"
-    env = Environment()
-    loc = GeneralResourceLocator()
-    env.init(str(urdf), loc)
-
-    sg = env.getSceneGraph()
     movable = (JointType.REVOLUTE, JointType.CONTINUOUS, JointType.PRISMATIC)
-
-    joints = {}
-    for j in sg.getJoints():
-        if j.type in movable:
-            lim = j.limits
-            joints[j.getName()] = (lim.lower, lim.upper)
+    # filter on type first - limits are read once, and only for movable joints
+    movable_limits = (
+        (j.getName(), j.limits)
+        for j in env_topology.getSceneGraph().getJoints() if j.type in movable
+    )
+    joints = {name: (lim.lower, lim.upper) for name, lim in movable_limits}
 
     assert len(joints) == 6
     assert joints["joint_1"] == pytest.approx((-3.1416, 3.1416), rel=1e-3)
     assert joints["joint_2"] == pytest.approx((-1.7453, 1.9199), rel=1e-3)
 
 
-def test_state_transforms():
+def test_state_transforms(env_topology):
     """Test state and link transforms."""
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-
-    urdf = FIXTURES / "abb_irb2400.urdf"
-    env = Environment()
-    loc = GeneralResourceLocator()
-    env.init(str(urdf), loc)
-
+    env = env_topology.clone()
     state = env.getState()
     assert "base_link" in state.link_transforms
     assert "tool0" in state.link_transforms
@@ -72,28 +68,14 @@ def test_state_transforms():
     assert state.joints["joint_1"] == pytest.approx(1.0)
 
 
-def test_scene_manager_load():
+def test_scene_manager_load(scene_abb_stats):
     """Test SceneManager loads environment."""
-    import vtk
-    from core.scene_manager import SceneManager
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-
-    urdf = FIXTURES / "abb_irb2400.urdf"
-    env = Environment()
-    loc = GeneralResourceLocator()
-    env.init(str(urdf), loc)
-
-    renderer = vtk.vtkRenderer()
-    scene = SceneManager(renderer)
-    scene.load_environment(env)
-
-    assert len(scene.link_actors) == 9
-    assert "base_link" in scene.link_actors
-    assert "tool0" in scene.link_actors
+    assert len(scene_abb_stats) == 9
+    assert "base_link" in scene_abb_stats
+    assert "tool0" in scene_abb_stats
 
 
-def test_mesh_geometry_loading():
+def test_mesh_geometry_loading(abb_mesh_links, scene_abb_stats):
     """Test all mesh geometries are loaded with valid VTK polydata.
 
     Verifies:
@@ -101,62 +83,24 @@ def test_mesh_geometry_loading():
     - Actors have valid geometry (non-zero points)
     - Actors have distinct positions (not all at origin)
     """
-    import vtk
-    from core.scene_manager import SceneManager
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-    from tesseract_robotics.tesseract_geometry import GeometryType as GT
-
-    urdf = FIXTURES / "abb_irb2400.urdf"
-    env = Environment()
-    loc = GeneralResourceLocator()
-    env.init(str(urdf), loc)
-
-    # Count mesh visuals in scene graph
-    sg = env.getSceneGraph()
-    mesh_links = []
-    for link in sg.getLinks():
-        for v in link.visual:
-            if v.geometry.getType() in (GT.MESH, GT.CONVEX_MESH, GT.POLYGON_MESH):
-                mesh_links.append(link.getName())
-                break
-
-    assert len(mesh_links) >= 7, f"Expected 7+ mesh links, got {len(mesh_links)}"
-
-    # Load into SceneManager
-    renderer = vtk.vtkRenderer()
-    scene = SceneManager(renderer)
-    scene.load_environment(env)
-
-    # Verify all mesh links have actors
-    for link in mesh_links:
-        assert link in scene.link_actors, f"Missing actor for mesh link: {link}"
-        actors = scene.link_actors[link]
-        assert len(actors) > 0, f"No actors for mesh link: {link}"
-
-        # Check actor has valid geometry
-        for actor in actors:
-            mapper = actor.GetMapper()
-            assert mapper is not None, f"No mapper for {link}"
-            polydata = mapper.GetInput()
-            assert polydata is not None, f"No polydata for {link}"
-            assert polydata.GetNumberOfPoints() > 0, f"No points in {link}"
+    assert len(abb_mesh_links) >= 7, f"Expected 7+ mesh links, got {len(abb_mesh_links)}"
 
-    # Verify actors have distinct bounds (not all overlapping)
-    centers = []
-    for link in mesh_links:
-        for actor in scene.link_actors[link]:
-            centers.append(actor.GetCenter())
+    # Verify all mesh links have actors with valid geometry
+    for link in abb_mesh_links:
+        assert link in scene_abb_stats, f"Missing actor for mesh link: {link}"
+        stats = scene_abb_stats[link]
+        assert len(stats) > 0, f"No actors for mesh link: {link}"
+        for _, n_points in stats:
+            assert n_points > 0, f"No points in {link}"
 
     # At least 5 unique positions (some tolerance for nearby links)
-    unique_positions = set()
-    for c in centers:
-        rounded = (round(c[0], 1), round(c[1], 1), round(c[2], 1))
-        unique_positions.add(rounded)
-    assert len(unique_positions) >= 5, f"Expected 5+ distinct positions, got {len(unique_positions)}"
+    centers = np.array([c for link in abb_mesh_links for c, _ in scene_abb_stats[link]])
+    n_unique = np.unique(np.round(centers * 10).astype(np.int32), axis=0).shape[0]
+    assert n_unique >= 5, f"Expected 5+ distinct positions, got {n_unique}"
 
 
-def test_compound_mesh_geometry():
+@pytest.mark.slow
+def test_compound_mesh_geometry(make_env, offscreen_renderer):
     """Test COMPOUND_MESH geometry (used by Kuka iiwa).
 
     Verifies:
@@ -164,22 +108,14 @@ def test_compound_mesh_geometry():
     - Multiple sub-meshes are combined
     - No crashes on complex mesh structures
     """
-    import vtk
-    import tesseract_robotics
-    from core.scene_manager import SceneManager
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-    from tesseract_robotics.tesseract_geometry import GeometryType as GT
-
     support_dir = Path(tesseract_robotics.get_tesseract_support_path())
     urdf = support_dir / "urdf" / "lbr_iiwa_14_r820.urdf"
 
     if not urdf.exists():
         pytest.skip("iiwa URDF not found in tesseract_support")
 
-    env = Environment()
-    loc = GeneralResourceLocator()
-    assert env.init(str(urdf), loc), f"Failed to load {urdf}"
+    env = make_env(urdf)
+    assert env is not None, f"Failed to load {urdf}"
 
     # Verify iiwa uses COMPOUND_MESH
     sg = env.getSceneGraph()
@@ -193,8 +129,7 @@ def test_compound_mesh_geometry():
     assert len(compound_links) >= 5, f"Expected 5+ COMPOUND_MESH links, got {len(compound_links)}"
 
     # Load into SceneManager - should not crash
-    renderer = vtk.vtkRenderer()
-    scene = SceneManager(renderer)
+    scene = SceneManager(offscreen_renderer)
     scene.load_environment(env)
 
     # Verify actors were created for compound mesh links
@@ -212,40 +147,47 @@ def test_compound_mesh_geometry():
             assert polydata.GetNumberOfPoints() > 0, f"Empty geometry for {link}"
 
 
-def test_scene_manager_update_joints():
+@pytest.fixture
+def scene_abb_joints(scene_abb, abb_env):
+    """shared scene_abb for joint updates - abb_env joint state restored after."""
+    joints = dict(abb_env.getState().joints)
+    yield scene_abb
+    abb_env.setState(joints)
+    scene_abb.update_from_state(abb_env.getState())
+
+
+def test_scene_manager_update_joints(scene_abb_joints, abb_env):
     """Test SceneManager updates joint values."""
-    import vtk
-    from core.scene_manager import SceneManager
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-
-    urdf = FIXTURES / "abb_irb2400.urdf"
-    env = Environment()
-    loc = GeneralResourceLocator()
-    env.init(str(urdf), loc)
-
-    renderer = vtk.vtkRenderer()
-    scene = SceneManager(renderer)
+    scene_abb_joints.update_joint_values({"joint_1": 0.5, "joint_2": -0.3})
+
+    joints = abb_env.getState().joints
+    assert joints["joint_1"] == pytest.approx(0.5)
+    assert joints["joint_2"] == pytest.approx(-0.3)
+
+
+def test_scene_manager_update_joint_positions(env, offscreen_renderer):
+    """Test SceneManager updates joints from a position array."""
+    scene = SceneManager(offscreen_renderer)
     scene.load_environment(env)
 
-    # Should not raise
-    scene.update_joint_values({"joint_1": 0.5, "joint_2": -0.3})
+    pos = np.zeros(6, np.float32)
+    pos[0] = 0.5
+    pos[1] = -0.3
+    scene.update_joint_positions(pos, JOINT_NAMES)
+
+    joints = env.getState().joints
+    assert joints["joint_1"] == pytest.approx(0.5)
+    assert joints["joint_2"] == pytest.approx(-0.3)
 
+    # joint order is cached after the first call
+    pos[0] = -0.25
+    scene.update_joint_positions(pos)
+    assert env.getState().joints["joint_1"] == pytest.approx(-0.25)
 
-def test_scene_manager_remove_link():
+
+def test_scene_manager_remove_link(env, offscreen_renderer):
     """Test SceneManager remove_link."""
-    import vtk
-    from core.scene_manager import SceneManager
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-
-    urdf = FIXTURES / "abb_irb2400.urdf"
-    env = Environment()
-    loc = GeneralResourceLocator()
-    env.init(str(urdf), loc)
-
-    renderer = vtk.vtkRenderer()
-    scene = SceneManager(renderer)
+    scene = SceneManager(offscreen_renderer)
     scene.load_environment(env)
 
     assert "link_1" in scene.link_actors
@@ -253,7 +195,8 @@ def test_scene_manager_remove_link():
     assert "link_1" not in scene.link_actors
 
 
-def test_reload_multiple_robots(qapp):
+@pytest.mark.slow
+def test_reload_multiple_robots(qapp, make_env, offscreen_renderer):
     """Test reloading multiple URDF/SRDF pairs doesn't break signal wiring.
 
     Loads several different robots sequentially and verifies:
@@ -262,14 +205,6 @@ def test_reload_multiple_robots(qapp):
     - Signals remain connected
     - Joint sliders match new robot
     """
-    import tesseract_robotics
-    from widgets.manipulation_widget import ManipulationWidget
-    from core.scene_manager import SceneManager
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator
-    from tesseract_robotics.tesseract_scene_graph import JointType
-    import vtk
-
     support_dir = Path(tesseract_robotics.get_tesseract_support_path())
     urdf_dir = support_dir / "urdf"
 
@@ -293,22 +228,16 @@ def test_reload_multiple_robots(qapp):
         pytest.skip("Need at least 2 robots in tesseract_support")
 
     # Create widgets
-    renderer = vtk.vtkRenderer()
-    scene = SceneManager(renderer)
+    scene = SceneManager(offscreen_renderer)
     manip = ManipulationWidget()
 
-    # Track signal emissions
-    joint_signals = []
-    manip.jointValuesChanged.connect(lambda v: joint_signals.append(v))
-
-    loc = GeneralResourceLocator()
     prev_joint_count = 0
     loaded_count = 0
 
     for urdf_path, srdf_path in valid_robots:
         # Load environment (some SRDFs have missing deps, skip those)
-        env = Environment()
-        if not env.init(str(urdf_path), str(srdf_path), loc):
+        env = make_env(urdf_path, srdf_path)
+        if env is None:
             continue  # Skip robots that fail to load
 
         loaded_count += 1
@@ -347,75 +276,68 @@ def test_reload_multiple_robots(qapp):
     assert loaded_count >= 2, f"Need 2+ robots to test reload, only loaded {loaded_count}"
 
 
-def test_contact_detection_with_joint_values():
-    """Test contact detection uses current joint state.
+@pytest.fixture(scope="session")
+def contact_manager(abb_env_srdf):
+    """discrete contact manager for abb_env_srdf, active links + 1cm margin."""
+    manager = abb_env_srdf.getDiscreteContactManager()
+    assert manager is not None, "Contact manager not available (needs SRDF)"
 
-    When joints are moved to collision pose, contact checker must detect it.
-    Requires SRDF for contact manager to be available.
-    Uses tesseract_support paths because SRDF needs package:// resolution.
-    """
-    import math
-    import tesseract_robotics  # Set up plugin paths
-    from tesseract_robotics.tesseract_environment import Environment
-    from tesseract_robotics.tesseract_common import GeneralResourceLocator, CollisionMarginData
-    from tesseract_robotics.tesseract_collision import (
-        ContactTestType, ContactRequest, ContactResultMap, ContactResultVector
-    )
+    manager.setActiveCollisionObjects(abb_env_srdf.getActiveLinkNames())
+    manager.setCollisionMarginData(CollisionMarginData(0.01))
+    return manager
 
-    # Use installed tesseract_support (has proper package:// resolution)
-    support_dir = Path(tesseract_robotics.get_tesseract_support_path())
-    if not support_dir.exists():
-        # Fallback to ws/install for dev mode
-        import os
-        support_dir = Path(os.environ.get("TESSERACT_SUPPORT_DIR", ""))
-    urdf = support_dir / "urdf" / "abb_irb2400.urdf"
-    srdf = support_dir / "urdf" / "abb_irb2400.srdf"
 
-    if not urdf.exists() or not srdf.exists():
-        pytest.skip("tesseract_support not found")
+@pytest.fixture(scope="session")
+def contact_buffers():
+    """reusable (ContactResultMap, ContactResultVector) pair.
 
-    env = Environment()
-    loc = GeneralResourceLocator()
-    assert env.init(str(urdf), str(srdf), loc), "Failed to init with SRDF"
+    Callers clear() both before each contactTest instead of allocating a
+    fresh pair per check - the same pattern per-frame contact checking wants.
+    """
+    return ContactResultMap(), ContactResultVector()
 
-    manager = env.getDiscreteContactManager()
-    assert manager is not None, "Contact manager not available (needs SRDF)"
 
-    manager.setActiveCollisionObjects(env.getActiveLinkNames())
-    manager.setCollisionMarginData(CollisionMarginData(0.01))
+HOME_JOINTS = dict.fromkeys(JOINT_NAMES, 0.0)
 
-    # Home position - no collision
-    home_joints = {f"joint_{i}": 0.0 for i in range(1, 7)}
-    env.setState(home_joints)
-    state = env.getState()
-    manager.setCollisionObjectsTransform(state.link_transforms)
-
-    request = ContactRequest(ContactTestType.ALL)
-    result_map = ContactResultMap()
-    manager.contactTest(result_map, request)
-    results = ContactResultVector()
-    result_map.flattenMoveResults(results)
-    assert len(results) == 0, f"Home pose should have no collisions, found {len(results)}"
-
-    # Collision pose: joint_2=110deg, joint_3=61deg
-    collision_joints = {
-        "joint_1": 0.0,
-        "joint_2": math.radians(110),
-        "joint_3": math.radians(61),
-        "joint_4": 0.0,
-        "joint_5": 0.0,
-        "joint_6": 0.0,
-    }
-    env.setState(collision_joints)
-    state = env.getState()
-    manager.setCollisionObjectsTransform(state.link_transforms)
+# joint_2=110deg, joint_3=61deg
+COLLISION_JOINTS = dict(zip(JOINT_NAMES, (0.0, math.radians(110), math.radians(61), 0.0, 0.0, 0.0)))
+
+POSES = {"home": HOME_JOINTS, "collision": COLLISION_JOINTS}
 
-    result_map2 = ContactResultMap()
-    manager.contactTest(result_map2, request)
-    results2 = ContactResultVector()
-    result_map2.flattenMoveResults(results2)
-    assert len(results2) > 0, "Collision pose should detect contacts"
 
-    # Verify joint state was actually updated
-    assert state.joints["joint_2"] == pytest.approx(math.radians(110), rel=1e-6)
-    assert state.joints["joint_3"] == pytest.approx(math.radians(61), rel=1e-6)
+@pytest.mark.xdist_group("abb_env_srdf")
+@pytest.mark.parametrize("pose, expect_contact", [
+    ("home", False),
+    ("collision", True),
+], ids=["home", "collision"])
+def test_contact_detection_with_joint_values(abb_env_srdf, contact_manager, contact_buffers,
+                                             pose, expect_contact):
+    """Test contact detection uses current joint state.
+
+    When joints are moved to collision pose, contact checker must detect it.
+    Requires SRDF for contact manager to be available.
+    Uses tesseract_support paths because SRDF needs package:// resolution.
+    """
+    initial = dict(abb_env_srdf.getState().joints)
+    try:
+        abb_env_srdf.setState(POSES[pose])
+        state = abb_env_srdf.getState()
+
+        # Verify joint state was actually updated
+        for name, value in POSES[pose].items():
+            assert state.joints[name] == pytest.approx(value, rel=1e-6)
+
+        contact_manager.setCollisionObjectsTransform(state.link_transforms)
+
+        result_map, results = contact_buffers
+        result_map.clear()
+        results.clear()
+        contact_manager.contactTest(result_map, ContactRequest(ContactTestType.ALL))
+        result_map.flattenMoveResults(results)
+    finally:
+        abb_env_srdf.setState(initial)  # session env is shared with other files
+
+    if expect_contact:
+        assert len(results) > 0, "Collision pose should detect contacts"
+    else:
+        assert len(results) == 0, f"Home pose should have no collisions, found {len(results)}"
@@ -0,0 +1,128 @@
+"""scale coherence tests - VTK actors vs tesseract geometry and FK."""
+from collections import namedtuple
+from importlib.util import find_spec
+
+import numpy as np
+import pytest
+
+LinkArrays = namedtuple("LinkArrays", ["names", "fk", "vtk", "bounds"])
+
+
+@pytest.fixture(scope="class")
+def env_and_scene(abb_env_srdf):
+    """session ABB environment plus a scene manager loaded once per class.
+
+    The renderer has no render window: the tests only read actor bounds and
+    centers, and SceneManager skips Render() when there is no window.
+    """
+    import vtk
+    from core.scene_manager import SceneManager
+
+    scene = SceneManager(vtk.vtkRenderer())
+    scene.load_environment(abb_env_srdf)
+    return abb_env_srdf, scene
+
+
+@pytest.fixture(scope="class")
+def link_arrays(env_and_scene):
+    """home-pose FK translations, actor centers (N, 3) and actor bounds (N, 6), gathered once."""
+    env, scene = env_and_scene
+    tfs = env.getState().link_transforms
+    names = [name for name, actors in scene.link_actors.items() if actors and name in tfs]
+    actors = [scene.link_actors[name][0] for name in names]
+    return LinkArrays(
+        names,
+        np.array([tfs[name].translation() for name in names]),
+        np.array([actor.GetCenter() for actor in actors]),
+        np.array([actor.GetBounds() for actor in actors]),
+    )
+
+
+@pytest.mark.skipif(find_spec("vtk") is None or find_spec("tesseract_robotics") is None,
+                    reason="vtk and tesseract_robotics required")
+@pytest.mark.xdist_group("abb_env_srdf")
+class TestScaleCoherence:
+    """test VTK actor scale matches tesseract geometry."""
+
+    def test_actor_bounds_match_geometry(self, env_and_scene, link_arrays):
+        """test VTK actor bounds match tesseract mesh geometry (within 5%)."""
+        env, scene = env_and_scene
+
+        names, verts = [], []
+        for link in env.getSceneGraph().getLinks():
+            name = link.getName()
+            if not link.visual or name not in scene.link_actors:
+                continue
+            # a list of per-vertex (3,) arrays, not one buffer - stacked below
+            link_verts = link.visual[0].geometry.getVertices()
+            if len(link_verts) == 0:
+                continue
+            names.append(name)
+            verts.append(link_verts)
+
+        assert verts, "no mesh links collected"
+
+        # tesseract mesh bounds - all links' vertices copied into one (V, 3)
+        # array exactly once, then one reduceat pass per bound
+        offsets = np.cumsum([0] + [len(v) for v in verts[:-1]])
+        stacked = np.vstack([v for link_verts in verts for v in link_verts])
+        geom_size = np.maximum.reduceat(stacked, offsets) - np.minimum.reduceat(stacked, offsets)
+
+        # VTK actor bounds, (N, 6) as xmin, xmax, ymin, ymax, zmin, zmax
+        row = {name: i for i, name in enumerate(link_arrays.names)}
+        bounds = link_arrays.bounds[[row[name] for name in names]]
+        actor_size = bounds[:, 1::2] - bounds[:, ::2]
+
+        # sizes should match within 5%, skipping tiny dimensions
+        ratio = np.divide(actor_size, geom_size,
+                          out=np.ones_like(actor_size), where=geom_size > 0.01)
+        bad = (ratio <= 0.95) | (ratio >= 1.05)
+        assert not bad.any(), [
+            f"{names[n]} axis {i}: geom={geom_size[n, i]:.3f}, actor={actor_size[n, i]:.3f}"
+            for n, i in np.argwhere(bad)
+        ]
+
+    def test_actor_motion_matches_fk(self, env_and_scene, link_arrays):
+        """test VTK actor moves correct distance when joints change."""
+        env, scene = env_and_scene
+
+        # initial link_6 FK position and VTK actor center
+        i = link_arrays.names.index('link_6')
+        pos0 = link_arrays.fk[i]
+        vtk_pos0 = link_arrays.vtk[i]
+        actor = scene.link_actors['link_6'][0]
+        state0 = env.getState()
+
+        # apply joint motion - restored afterwards, the environment is session-wide
+        motion = {'joint_1': 1.5, 'joint_2': -0.5, 'joint_3': 0.5}
+        restore = {name: state0.joints[name] for name in motion}
+        try:
+            scene.update_joint_values(motion)
+
+            # get new positions
+            state1 = env.getState()
+            pos1 = np.array(state1.link_transforms['link_6'].translation())
+            vtk_pos1 = np.array(actor.GetCenter())
+        finally:
+            scene.update_joint_values(restore)
+
+        # FK motion
+        fk_motion = np.linalg.norm(pos1 - pos0)
+        vtk_motion = np.linalg.norm(vtk_pos1 - vtk_pos0)
+
+        # VTK motion should match FK motion within 10%
+        assert fk_motion > 0.3, f"FK motion too small: {fk_motion:.3f}m"
+        assert abs(vtk_motion - fk_motion) / fk_motion < 0.1, \
+            f"Motion mismatch: FK={fk_motion:.3f}m, VTK={vtk_motion:.3f}m"
+
+    def test_link_positions_coherent(self, link_arrays):
+        """test all VTK actor positions within 10cm of tesseract FK."""
+        names, fk_pos, vtk_pos, _ = link_arrays
+
+        # positions should be within 0.5m (mesh center vs link origin)
+        dist = np.linalg.norm(vtk_pos - fk_pos, axis=1)
+        far = dist >= 0.5
+        assert not far.any(), [
+            f"{names[n]}: FK={fk_pos[n]}, VTK={vtk_pos[n]}, dist={dist[n]:.3f}m"
+            for n in np.flatnonzero(far)
+        ]
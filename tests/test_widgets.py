@@ -1,6 +1,20 @@
 """Test widget functionality."""
+import re
+from pathlib import Path
+
 import pytest
 
+# app.py static checks - dock creation, View menu toggle actions, default size
+DOCK_RE = re.compile(r'self\.(\w+_dock)\s*=\s*QDockWidget')
+MENU_RE = re.compile(r'view_menu\.addAction\(self\.(\w+_dock)\.toggleViewAction')
+RESIZE_RE = re.compile(r'self\.resize\((\d+),\s*(\d+)\)')
+
+
+@pytest.fixture(scope="module")
+def app_source():
+    """app.py source text, read once for the static checks below."""
+    return (Path(__file__).parent.parent / "app.py").read_text()
+
 
 def test_plot_widget_load_trajectory(qapp):
     """Test PlotWidget loads trajectory data."""
@@ -82,34 +96,19 @@ def test_scene_tree_signals(qapp):
     assert hasattr(widget, 'linkDeleteRequested')
 
 
-def test_all_docks_in_view_menu():
+def test_all_docks_in_view_menu(app_source):
     """Test all dock widgets are accessible via View menu."""
-    from pathlib import Path
-    import re
-
-    app_py = Path(__file__).parent.parent / "app.py"
-    content = app_py.read_text()
-
-    dock_pattern = r'self\.(\w+_dock)\s*=\s*QDockWidget'
-    created_docks = set(re.findall(dock_pattern, content))
-
-    menu_pattern = r'view_menu\.addAction\(self\.(\w+_dock)\.toggleViewAction'
-    menu_docks = set(re.findall(menu_pattern, content))
+    created_docks = set(DOCK_RE.findall(app_source))
+    menu_docks = set(MENU_RE.findall(app_source))
 
     missing = created_docks - menu_docks
     assert not missing, f"Docks missing from View menu: {missing}"
 
 
-def test_window_size_reasonable():
+def test_window_size_reasonable(app_source):
     """Test app.py configures reasonable window size."""
-    from pathlib import Path
-    import re
-
-    app_py = Path(__file__).parent.parent / "app.py"
-    content = app_py.read_text()
-
     # Check resize() call
-    match = re.search(r'self\.resize\((\d+),\s*(\d+)\)', content)
+    match = RESIZE_RE.search(app_source)
     assert match, "No resize() call found"
 
     width, height = int(match.group(1)), int(match.group(2))
@@ -153,12 +152,8 @@ class TestCartesianEditor:
         widget.set_pose(1.0, 0.5, 0.8, radians(45), radians(30), radians(-90))
 
         x, y, z, r, p, yaw = widget.get_pose()
-        assert abs(x - 1.0) < 0.01
-        assert abs(y - 0.5) < 0.01
-        assert abs(z - 0.8) < 0.01
-        assert abs(r - radians(45)) < 0.01
-        assert abs(p - radians(30)) < 0.01
-        assert abs(yaw - radians(-90)) < 0.01
+        expected = (1.0, 0.5, 0.8, radians(45), radians(30), radians(-90))
+        assert (x, y, z, r, p, yaw) == pytest.approx(expected, abs=0.01)
 
     def test_slider_spinbox_sync(self, qapp):
         """Test slider and spinbox stay synchronized."""
@@ -172,22 +167,22 @@ class TestCartesianEditor:
 
         # Set via slider
         widget.y_slider.setValue(250)
-        assert abs(widget.y_spin.value() - 0.25) < 0.001
+        assert widget.y_spin.value() == pytest.approx(0.25, abs=0.001)
 
     def test_pose_changed_signal(self, qapp):
         """Test poseChanged signal emits on value change."""
+        from PySide6.QtTest import QSignalSpy
+
         from widgets.cartesian_editor import CartesianEditorWidget
 
         widget = CartesianEditorWidget()
-        received = []
-
-        widget.poseChanged.connect(lambda *args: received.append(args))
+        spy = QSignalSpy(widget.poseChanged)
 
         # Trigger change
         widget.x_spin.setValue(0.3)
 
-        assert len(received) > 0
-        assert abs(received[-1][0] - 0.3) < 0.01  # X value
+        assert spy.count() > 0
+        assert spy.at(spy.count() - 1)[0] == pytest.approx(0.3, abs=0.01)  # X value
 
     def test_get_xyz(self, qapp):
         """Test get_xyz returns position only."""
@@ -197,10 +192,8 @@ class TestCartesianEditor:
         widget.set_pose(1.0, 2.0, 3.0, 0.1, 0.2, 0.3)
 
         xyz = widget.get_xyz()
-        assert len(xyz) == 3
-        assert abs(xyz[0] - 1.0) < 0.01
-        assert abs(xyz[1] - 2.0) < 0.01
-        assert abs(xyz[2] - 2.0) < 0.01  # Clamped to range max 2.0
+        # z clamped to range max 2.0
+        assert tuple(xyz) == pytest.approx((1.0, 2.0, 2.0), abs=0.01)
 
     def test_get_rpy_radians(self, qapp):
         """Test get_rpy_radians returns orientation in radians."""
@@ -211,10 +204,8 @@ class TestCartesianEditor:
         widget.set_pose(0, 0, 0, radians(90), radians(45), radians(-45))
 
         rpy = widget.get_rpy_radians()
-        assert len(rpy) == 3
-        assert abs(rpy[0] - radians(90)) < 0.01
-        assert abs(rpy[1] - radians(45)) < 0.01
-        assert abs(rpy[2] - radians(-45)) < 0.01
+        expected = (radians(90), radians(45), radians(-45))
+        assert tuple(rpy) == pytest.approx(expected, abs=0.01)
 
 
 class TestFKIKWidget:
@@ -231,15 +222,12 @@ class TestFKIKWidget:
         assert hasattr(widget, 'jointValuesChanged')
         assert hasattr(widget, 'ikSolveRequested')
 
-    def test_ik_solve_moves_vtk_actors(self, qapp):
+    def test_ik_solve_moves_vtk_actors(self, qapp, make_env, offscreen_renderer):
         """Test IK solve updates VTK actor positions."""
         from pathlib import Path
         from widgets.fkik_widget import FKIKWidget
         from core.scene_manager import SceneManager
         import tesseract_robotics
-        from tesseract_robotics.tesseract_environment import Environment
-        from tesseract_robotics.tesseract_common import GeneralResourceLocator
-        import vtk
 
         # Load robot with SRDF for kinematic group
         support_dir = Path(tesseract_robotics.get_tesseract_support_path())
@@ -249,13 +237,11 @@ class TestFKIKWidget:
         if not urdf.exists() or not srdf.exists():
             pytest.skip("tesseract_support not found")
 
-        env = Environment()
-        loc = GeneralResourceLocator()
-        assert env.init(str(urdf), str(srdf), loc)
+        env = make_env(urdf, srdf)
+        assert env is not None
 
         # Create scene manager and load environment
-        renderer = vtk.vtkRenderer()
-        scene = SceneManager(renderer)
+        scene = SceneManager(offscreen_renderer)
         scene.load_environment(env)
 
         # Get initial link_6 actor position (tool0 has no geometry)
@@ -294,13 +280,11 @@ class TestFKIKWidget:
         assert pos_changed, \
             f"VTK actor should move after IK. Initial: {initial_pos}, New: {new_pos}"
 
-    def test_fk_updates_ik_display(self, qapp):
+    def test_fk_updates_ik_display(self, qapp, make_env):
         """Test FK slider changes update IK Cartesian display."""
         from pathlib import Path
         from widgets.fkik_widget import FKIKWidget
         import tesseract_robotics
-        from tesseract_robotics.tesseract_environment import Environment
-        from tesseract_robotics.tesseract_common import GeneralResourceLocator
 
         # Load robot with SRDF for kinematic group
         support_dir = Path(tesseract_robotics.get_tesseract_support_path())
@@ -310,9 +294,8 @@ class TestFKIKWidget:
         if not urdf.exists() or not srdf.exists():
             pytest.skip("tesseract_support not found")
 
-        env = Environment()
-        loc = GeneralResourceLocator()
-        assert env.init(str(urdf), str(srdf), loc)
+        env = make_env(urdf, srdf)
+        assert env is not None
 
         widget = FKIKWidget()
         widget.set_environment(env, "manipulator", "tool0")
@@ -337,13 +320,11 @@ class TestFKIKWidget:
         # Y position should have changed (joint 1 rotates around Z)
         assert new_pose != initial_pose, "IK display should update when FK changes"
 
-    def test_ik_solve_updates_fk(self, qapp):
+    def test_ik_solve_updates_fk(self, qapp, make_env):
         """Test IK solve updates FK sliders."""
         from pathlib import Path
         from widgets.fkik_widget import FKIKWidget
         import tesseract_robotics
-        from tesseract_robotics.tesseract_environment import Environment
-        from tesseract_robotics.tesseract_common import GeneralResourceLocator
 
         # Load robot with SRDF for kinematic group
         support_dir = Path(tesseract_robotics.get_tesseract_support_path())
@@ -353,9 +334,8 @@ class TestFKIKWidget:
         if not urdf.exists() or not srdf.exists():
             pytest.skip("tesseract_support not found")
 
-        env = Environment()
-        loc = GeneralResourceLocator()
-        assert env.init(str(urdf), str(srdf), loc)
+        env = make_env(urdf, srdf)
+        assert env is not None
 
         widget = FKIKWidget()
         widget.set_environment(env, "manipulator", "tool0")
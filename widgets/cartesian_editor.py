@@ -102,6 +102,7 @@ class CartesianEditorWidget(QWidget):
         spin.setDecimals(3)
         spin.setSingleStep(0.01 if abs(max_val) <= 10 else 1.0)
         spin.setValue(default)
+        spin.setKeyboardTracking(False)  # emit on commit, not per keystroke
         spin.setFixedWidth(80)
         layout.addWidget(spin, row, 2)
 
@@ -1,7 +1,7 @@
 """Group states editor widget."""
 from __future__ import annotations
 
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import QSignalBlocker, Signal, Qt
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -74,11 +74,25 @@ class GroupStatesEditorWidget(QWidget):
 
         layout.addLayout(btn_layout)
 
-    def set_groups(self, groups: list[str]):
-        """Set available groups."""
+    def set_groups(self, groups: list[str], emit_signal: bool = True):
+        """Set available groups.
+
+        Args:
+            groups: Group names for the combo
+            emit_signal: If False, group_combo emits no currentTextChanged while it
+                         is repopulated and the table is refreshed once instead
+        """
         self._groups = groups
-        self.group_combo.clear()
-        self.group_combo.addItems(groups)
+        if emit_signal:
+            self.group_combo.clear()
+            self.group_combo.addItems(groups)
+            return
+        # clear() and addItems() each fire currentTextChanged (-> _refresh_table);
+        # blocking also hides them from outside listeners, so it is opt-in
+        with QSignalBlocker(self.group_combo):
+            self.group_combo.clear()
+            self.group_combo.addItems(groups)
+        self._refresh_table()
 
     def set_states(self, states: dict[str, dict[str, dict]]):
         """Set states dict: {group: {state_name: {joint: value}}}."""
@@ -14,21 +14,27 @@ from PySide6.QtWidgets import (
 )
 
 
-def rotation_matrix_to_rpy(R: np.ndarray) -> tuple[float, float, float]:
-    """Convert 3x3 rotation matrix to roll-pitch-yaw (XYZ Euler angles)."""
-    sy = np.sqrt(R[0, 0]**2 + R[1, 0]**2)
+def rotation_matrix_to_rpy(
+    R: np.ndarray,
+) -> tuple[float | np.ndarray, float | np.ndarray, float | np.ndarray]:
+    """Convert a (..., 3, 3) rotation matrix stack to roll-pitch-yaw (XYZ Euler) arrays.
+
+    Each of roll, pitch, yaw has the stack's leading shape; a single 3x3
+    matrix gives three float scalars.
+    """
+    R = np.asarray(R, dtype=float)
+    sy = np.hypot(R[..., 0, 0], R[..., 1, 0])
     singular = sy < 1e-6
 
-    if not singular:
-        roll = np.arctan2(R[2, 1], R[2, 2])
-        pitch = np.arctan2(-R[2, 0], sy)
-        yaw = np.arctan2(R[1, 0], R[0, 0])
-    else:
-        roll = np.arctan2(-R[1, 2], R[1, 1])
-        pitch = np.arctan2(-R[2, 0], sy)
-        yaw = 0
+    roll = np.where(
+        singular,
+        np.arctan2(-R[..., 1, 2], R[..., 1, 1]),
+        np.arctan2(R[..., 2, 1], R[..., 2, 2]),
+    )
+    pitch = np.arctan2(-R[..., 2, 0], sy)
+    yaw = np.where(singular, 0.0, np.arctan2(R[..., 1, 0], R[..., 0, 0]))
 
-    return roll, pitch, yaw
+    return roll[()], pitch[()], yaw[()]
 
 
 class RobotInfoPanel(QWidget):
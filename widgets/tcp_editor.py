@@ -1,7 +1,9 @@
 """TCP (Tool Center Point) editor widget."""
 from __future__ import annotations
 
-from PySide6.QtCore import Signal
+from contextlib import ExitStack
+
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -81,12 +83,15 @@ class TCPEditorWidget(QWidget):
         self.offset_changed.emit(x, y, z, rx, ry, rz)
 
     def _on_reset(self):
-        self.offset_editor.x_spin.setValue(0.0)
-        self.offset_editor.y_spin.setValue(0.0)
-        self.offset_editor.z_spin.setValue(0.0)
-        self.offset_editor.roll_spin.setValue(0.0)
-        self.offset_editor.pitch_spin.setValue(0.0)
-        self.offset_editor.yaw_spin.setValue(0.0)
+        # zero all six axes silently, then emit offset_changed once
+        editor = self.offset_editor
+        spins = (editor.x_spin, editor.y_spin, editor.z_spin,
+                 editor.roll_spin, editor.pitch_spin, editor.yaw_spin)
+        with ExitStack() as blockers:  # unblocks even if set_pose raises
+            for spin in spins:
+                blockers.enter_context(QSignalBlocker(spin))
+            editor.set_pose(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)  # also syncs the sliders
+        self._on_offset_changed()
 
     def _on_apply(self):
         self._on_offset_changed()
@@ -1,6 +1,7 @@
 """Trajectory playback widget."""
 from __future__ import annotations
 
+import numpy as np
 from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtWidgets import (
     QWidget,
@@ -22,6 +23,9 @@ class TrajectoryPlayerWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._trajectory = None
+        self._positions = None  # (N, DOF) when loaded as arrays
+        self._times = None  # (N,) when loaded as arrays
+        self._joint_names = None  # column order of _positions
         self._frame = 0
         self._frame_count = 0
         self._playing = False
@@ -84,15 +88,29 @@ class TrajectoryPlayerWidget(QWidget):
         self.slider.valueChanged.connect(self._on_slider_changed)
         layout.addWidget(self.slider)
 
-    def load_trajectory(self, trajectory):
+    def load_trajectory(self, trajectory=None, *, positions=None, times=None, joint_names=None):
         """Load JointTrajectory for playback.
 
         Args:
             trajectory: tesseract_robotics JointTrajectory or compatible structure
-                       Expected to have waypoints accessible via iteration or indexing
+                       Expected to have waypoints accessible via iteration or indexing.
+            positions: (N, DOF) joint positions, used instead of trajectory.
+                       Stored contiguously for O(1) frame access.
+            times: (N,) timestamps matching positions
+            joint_names: column order of positions
         """
-        self._trajectory = trajectory
-        self._frame_count = len(trajectory) if trajectory else 0
+        if positions is not None:
+            self._positions = np.asarray(positions)
+            self._times = np.asarray(times) if times is not None else None
+            self._joint_names = list(joint_names) if joint_names is not None else None
+            self._trajectory = None
+            self._frame_count = self._positions.shape[0]
+        else:
+            self._positions = None
+            self._times = None
+            self._joint_names = None
+            self._trajectory = trajectory
+            self._frame_count = len(trajectory) if trajectory else 0
         self._frame = 0
 
         self._updating = True
@@ -187,7 +205,10 @@ class TrajectoryPlayerWidget(QWidget):
 
         # Get timestamp from trajectory if available
         time = 0.0
-        if self._trajectory and self._frame_count > 0 and frame_idx < self._frame_count:
+        if self._times is not None:
+            if frame_idx < self._frame_count:
+                time = float(self._times[frame_idx])
+        elif self._trajectory and self._frame_count > 0 and frame_idx < self._frame_count:
             try:
                 waypoint = self._trajectory[frame_idx]
                 # Try common attributes for time
@@ -218,9 +239,17 @@ class TrajectoryPlayerWidget(QWidget):
         """Check if currently playing."""
         return self._playing
 
+    def get_joint_names(self) -> list[str] | None:
+        """Get column order of loaded positions (None if not given or not array-loaded)."""
+        return self._joint_names
+
     def get_waypoint(self):
-        """Get current waypoint from trajectory."""
+        """Get current waypoint from trajectory (positions row for array trajectories)."""
         frame_idx = int(self._frame)
+        if self._positions is not None:
+            if 0 <= frame_idx < self._frame_count:
+                return self._positions[frame_idx]
+            return None
         if self._trajectory and 0 <= frame_idx < self._frame_count:
             return self._trajectory[frame_idx]
         return None